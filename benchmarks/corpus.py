@@ -0,0 +1,117 @@
+"""Генератор воспроизводимого синтетического корпуса адресных строк
+для замеров производительности RegionFinder."""
+
+import csv
+import random
+from typing import Dict, List
+
+from region_finder_ru.gazetteer import GAZETTEER_CSV
+from region_finder_ru.reference import REGIONS_CSV
+
+STREET_TYPES = ('ул.', 'улица', 'пр-кт', 'проспект', 'пер.', 'переулок',
+                'ш.', 'шоссе', 'б-р', 'наб.', 'пл.', 'туп.', 'пр-зд')
+STREET_NAMES = ('Ленина', 'Мира', 'Советская', 'Гагарина', 'Пушкина',
+                'Кирова', 'Молодежная', 'Центральная', 'Садовая',
+                'Лесная', '8 Марта', 'Карла Маркса', 'Победы')
+DISTRICTS = ('Кушвинский', 'Красновишерский', 'Мариинско-Посадский',
+             'Кемеровский', 'Ленинский', 'Октябрьский', 'Центральный')
+SETTLEMENT_MARKERS = ('п.', 'с.', 'пгт', 'пгт.', 'село', 'поселок',
+                      'р.п.', 'н.п.')
+WORDS = ('договор', 'поставки', 'оплата', 'счет', 'товар', 'услуги',
+         'акт', 'сверки', 'приложение', 'номер', 'от', 'года', 'сумма',
+         'ндс', 'включая', 'рублей', 'исполнитель', 'заказчик')
+
+# Доли видов строк в корпусе
+KINDS = (('address', 0.45), ('declined', 0.15),
+         ('non_address', 0.35), ('pathological', 0.05))
+
+
+def _load_regions() -> List[Dict[str, str]]:
+    with open(REGIONS_CSV, encoding='utf-8', newline='') as stream:
+        return list(csv.DictReader(stream))
+
+
+def _load_places() -> List[str]:
+    with open(GAZETTEER_CSV, encoding='utf-8', newline='') as stream:
+        return [row['name'].title() for row in csv.DictReader(stream)
+                if row['kind'] == 'city']
+
+
+def _declined(name: str) -> str:
+    """Возвращает название субъекта в родительном падеже."""
+
+    words = name.split()
+    if words[-1] == 'область':
+        return ' '.join([words[0][:-2] + 'ой'] + words[1:-1] + ['области'])
+    if words[-1] == 'край':
+        return ' '.join([words[0][:-2] + 'ого'] + words[1:-1] + ['края'])
+    if words[0] == 'Республика':
+        return ' '.join(['республики'] + words[1:])
+    return name
+
+
+class CorpusGenerator:
+    """Класс CorpusGenerator создаёт воспроизводимый при одном
+    и том же seed набор строк: адресов, адресов с регионами
+    в родительном падеже, строк без адреса и строк, на которых
+    регулярные выражения работают дольше всего."""
+
+    def __init__(self, seed: int = 0) -> None:
+        self._random = random.Random(seed)
+        self._regions = _load_regions()
+        self._cities = _load_places()
+
+    def _postcode(self) -> str:
+        return '{:06d}'.format(self._random.randint(101000, 694999))
+
+    def address(self) -> str:
+        choice = self._random.choice
+        parts = []
+        if self._random.random() < 0.7:
+            parts.append(self._postcode())
+        if self._random.random() < 0.7:
+            parts.append(choice(self._regions)['name'])
+        if self._random.random() < 0.8:
+            parts.append(choice(('г.', 'г', 'город')) + ' '
+                         + choice(self._cities))
+        if self._random.random() < 0.3:
+            parts.append(choice(DISTRICTS) + ' '
+                         + choice(('район', 'р-н', 'р-он')))
+        if self._random.random() < 0.3:
+            parts.append(choice(SETTLEMENT_MARKERS) + ' '
+                         + choice(self._cities))
+        parts.append(choice(STREET_TYPES) + ' ' + choice(STREET_NAMES))
+        parts.append('д. {}'.format(self._random.randint(1, 200)))
+        self._random.shuffle(parts)
+        return ', '.join(parts)
+
+    def declined(self) -> str:
+        region = _declined(self._random.choice(self._regions)['name'])
+        return '{}, {} {}'.format(self._random.choice(self._cities),
+                                  region, self._random.choice(WORDS))
+
+    def non_address(self) -> str:
+        words = [self._random.choice(WORDS)
+                 for _ in range(self._random.randint(3, 15))]
+        if self._random.random() < 0.3:
+            words.append(str(self._random.randint(1, 99999)))
+        return ' '.join(words).capitalize()
+
+    def pathological(self) -> str:
+        length = self._random.randint(500, 2000)
+        return self._random.choice((
+            'а' * length,
+            'а1' * (length // 2),
+            'а-' * (length // 2),
+            'г. ' + 'новая ' * (length // 6),
+            'а' * length + ' обл',
+            'а' * length + ' р-н',
+        ))
+
+    def generate(self, size: int) -> List[str]:
+        """Возвращает список из size строк."""
+
+        kinds = [kind for kind, _ in KINDS]
+        weights = [weight for _, weight in KINDS]
+        return [getattr(self, kind)()
+                for kind in self._random.choices(kinds, weights, k=size)]
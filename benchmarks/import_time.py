@@ -0,0 +1,63 @@
+"""Замер времени импорта пакета и первого поиска в новом процессе.
+
+Каждый замер выполняется в отдельном интерпретаторе, берётся лучший
+из нескольких запусков. Запуск завершается с кодом 1, если импорт
+дольше бюджета.
+
+    python -m benchmarks.import_time --budget 50
+"""
+
+import argparse
+import subprocess
+import sys
+from typing import Dict, Optional, Sequence
+
+# Бюджет времени импорта в миллисекундах
+IMPORT_BUDGET_MS = 50.0
+
+_SCRIPT = '''
+import time
+started = time.perf_counter()
+from region_finder_ru import InMemoryRegionFinder
+imported = time.perf_counter()
+InMemoryRegionFinder('634050 г. Томск, ул. Ленина').define_regions()
+found = time.perf_counter()
+print((imported - started) * 1000, (found - imported) * 1000)
+'''
+
+
+def measure(repeat: int) -> Dict[str, float]:
+    """Возвращает лучшее время импорта и первого поиска
+    в миллисекундах."""
+
+    best = {'import': float('inf'), 'first_find': float('inf')}
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', _SCRIPT],
+                                check=True, stdout=subprocess.PIPE,
+                                universal_newlines=True).stdout
+        imported, found = map(float, output.split())
+        best['import'] = min(best['import'], imported)
+        best['first_find'] = min(best['first_find'], found)
+    return best
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.import_time')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--budget', type=float, default=IMPORT_BUDGET_MS,
+                        help='бюджет времени импорта в миллисекундах')
+    args = parser.parse_args(argv)
+
+    results = measure(args.repeat)
+    for name, value in results.items():
+        print('{:32} {:10.2f} мс'.format(name, value))
+
+    if results['import'] > args.budget:
+        print('Импорт дольше бюджета {} мс'.format(args.budget),
+              file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""Замеры производительности RegionFinder на синтетическом корпусе.
+
+Результаты записываются в JSON. Если передан файл с предыдущими
+результатами, запуск завершается с кодом 1 при замедлении
+любого замера больше порога.
+
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --baseline results.json --threshold 0.2
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+from region_finder_ru import RegionFinder
+
+from .corpus import CorpusGenerator
+
+METHODS = ('_are_street_attrs_in_address', '_find_postcodes',
+           '_find_first_3_postcodes', '_find_region_names',
+           '_find_city_names', '_find_district_names',
+           '_find_settlement_names', 'is_address')
+
+
+class BenchmarkFinder(RegionFinder):
+
+    def define_regions(self):
+        return None
+
+
+def _best_of(repeat: int, function: Callable[[], None]) -> float:
+    """Возвращает лучшее время из repeat запусков."""
+
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run(corpus: List[str], repeat: int) -> Dict[str, float]:
+    """Возвращает время обработки одной строки корпуса
+    в микросекундах для каждого замера."""
+
+    finders = [BenchmarkFinder(address) for address in corpus]
+    results = {}
+
+    results['_beatify_address'] = _best_of(repeat, lambda: [
+        RegionFinder._beatify_address(address) for address in corpus])
+    for method in METHODS:
+        def measure(method=method):
+            for finder in finders:
+                finder._memo = {}
+                getattr(finder, method)()
+        results[method] = _best_of(repeat, measure)
+    results['find_many'] = _best_of(
+        repeat, lambda: list(RegionFinder.find_many(corpus)))
+
+    return {name: seconds / len(corpus) * 1e6
+            for name, seconds in results.items()}
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float],
+            threshold: float) -> List[str]:
+    """Возвращает описания замеров, замедлившихся больше порога."""
+
+    regressions = []
+    for name, value in sorted(results.items()):
+        previous = baseline.get(name)
+        if previous and value > previous * (1 + threshold):
+            regressions.append('{}: {:.2f} -> {:.2f} мкс/строка (+{:.0%})'
+                               .format(name, previous, value,
+                                       value / previous - 1))
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.run')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--size', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help='файл для записи результатов')
+    parser.add_argument('--baseline', help='файл предыдущих результатов')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='допустимое замедление (0.2 - на 20%%)')
+    args = parser.parse_args(argv)
+
+    corpus = CorpusGenerator(args.seed).generate(args.size)
+    results = run(corpus, args.repeat)
+
+    for name, value in results.items():
+        print('{:32} {:10.2f} мкс/строка'.format(name, value))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as stream:
+            json.dump({'python': platform.python_version(),
+                       'seed': args.seed, 'size': args.size,
+                       'results': results}, stream, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as stream:
+            baseline = json.load(stream)['results']
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print('Замедление больше порога:', file=sys.stderr)
+            for regression in regressions:
+                print('  ' + regression, file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
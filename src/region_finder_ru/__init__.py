@@ -1 +1,60 @@
-from .region_finder_ru import RegionFinder
+"""Поиск признаков регионов РФ в адресных строках.
+
+Модули пакета импортируются при первом обращении к их именам,
+поэтому import region_finder_ru не загружает модули, которые
+не используются (sqlite3, concurrent.futures и т.п.).
+"""
+
+import sys
+from importlib import import_module
+
+# Совпадает с version в pyproject.toml, входит в версию кеша результатов
+__version__ = '0.0.2'
+
+# Имя - модуль пакета, в котором оно определено
+_EXPORTS = {
+    'CacheStats': 'cache',
+    'ExtractionCache': 'cache',
+    'CompactBatch': 'compact',
+    'CompactRow': 'compact',
+    'Extractor': 'extractor',
+    'FuzzyIndex': 'fuzzy',
+    'FuzzyMatch': 'fuzzy',
+    'Gazetteer': 'gazetteer',
+    'GazetteerMatch': 'gazetteer',
+    'MappedReferenceData': 'mapped',
+    'compile_reference': 'mapped',
+    'normalize_address': 'normalization',
+    'SqliteExtractionCache': 'persistent_cache',
+    'InMemoryRegionFinder': 'reference',
+    'ReferenceData': 'reference',
+    'Region': 'reference',
+    'Resolution': 'reference',
+    'AddressResult': 'region_finder_ru',
+    'RegionFinder': 'region_finder_ru',
+    'Span': 'spans',
+    'SpanScanner': 'spans',
+    'iter_spans': 'spans',
+    'scan_file': 'spans',
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(
+            'module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module('.' + _EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+# До Python 3.7 модули не поддерживают __getattr__ (PEP 562)
+if sys.version_info < (3, 7):
+    for _name in _EXPORTS:
+        __getattr__(_name)
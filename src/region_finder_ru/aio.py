@@ -0,0 +1,110 @@
+"""Асинхронный интерфейс для использования в asyncio-приложениях.
+
+Регулярные выражения выполняются не в цикле событий, а в пуле потоков
+или процессов, поэтому длинные адреса не блокируют обработку других
+запросов. Для параллельной обработки на нескольких ядрах передайте
+ProcessPoolExecutor: в пуле потоков регулярные выражения выполняются
+под GIL по очереди.
+"""
+
+import asyncio
+from collections import deque
+from concurrent.futures import Executor
+from typing import (AsyncIterable, AsyncIterator, Iterable, List, Optional,
+                    Type, Union)
+
+from .region_finder_ru import AddressResult, RegionFinder
+
+
+def _find_chunk(finder: Type[RegionFinder],
+                addresses: List[str]) -> List[AddressResult]:
+    """Обрабатывает часть адресов в пуле потоков или процессов."""
+
+    return list(finder.find_many(addresses))
+
+
+async def _chunks(addresses: Union[Iterable[str], AsyncIterable[str]],
+                  size: int) -> AsyncIterator[List[str]]:
+    """Делит обычный или асинхронный поток адресов на части."""
+
+    chunk = []
+    if hasattr(addresses, '__aiter__'):
+        async for address in addresses:
+            chunk.append(address)
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+    else:
+        for address in addresses:
+            chunk.append(address)
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+async def iter_find_many(
+        addresses: Union[Iterable[str], AsyncIterable[str]],
+        finder: Type[RegionFinder] = RegionFinder,
+        executor: Optional[Executor] = None,
+        chunk_size: int = 100,
+        max_pending: int = 4) -> AsyncIterator[AddressResult]:
+    """Асинхронный аналог RegionFinder.find_many: возвращает результаты
+    в порядке входных строк.
+
+    Адреса обрабатываются частями по chunk_size строк в executor
+    (по умолчанию - пул потоков цикла событий). Одновременно
+    в обработке не более max_pending частей, и следующие адреса
+    не читаются из addresses, пока результаты не заберут."""
+
+    if chunk_size < 1:
+        raise ValueError('Размер части должен быть положительным')
+    if max_pending < 1:
+        raise ValueError('Количество частей в обработке '
+                         'должно быть положительным')
+
+    loop = asyncio.get_event_loop()
+    chunks = _chunks(addresses, chunk_size).__aiter__()
+    pending = deque()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < max_pending:
+                try:
+                    chunk = await chunks.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                pending.append(loop.run_in_executor(
+                    executor, _find_chunk, finder, chunk))
+            if not pending:
+                return
+            for result in await pending.popleft():
+                yield result
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+async def find_many_async(
+        addresses: Union[Iterable[str], AsyncIterable[str]],
+        finder: Type[RegionFinder] = RegionFinder,
+        executor: Optional[Executor] = None,
+        chunk_size: int = 100,
+        max_pending: int = 4) -> List[AddressResult]:
+    """Возвращает список результатов iter_find_many."""
+
+    return [result async for result in iter_find_many(
+        addresses, finder, executor, chunk_size, max_pending)]
+
+
+async def find_async(address: str,
+                     finder: Type[RegionFinder] = RegionFinder,
+                     executor: Optional[Executor] = None) -> AddressResult:
+    """Ищет признаки регионов в одной адресной строке в executor."""
+
+    loop = asyncio.get_event_loop()
+    results = await loop.run_in_executor(
+        executor, _find_chunk, finder, [address])
+    return results[0]
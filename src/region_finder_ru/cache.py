@@ -0,0 +1,101 @@
+import threading
+from collections import OrderedDict
+from typing import Hashable, NamedTuple, Optional
+
+
+class CacheStats(NamedTuple):
+    """Счётчики кеша результатов поиска. maxsize равен 0,
+    если размер кеша не ограничен."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Доля обращений к кешу, завершившихся попаданием."""
+
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ExtractionCache:
+    """Класс ExtractionCache - ограниченный по размеру LRU-кеш
+    результатов поиска, ключом которого служит подготовленная
+    адресная строка.
+
+    Методы кеша защищены блокировкой, поэтому один кеш можно
+    использовать из нескольких потоков.
+
+    Атрибуты
+    ----------
+    maxsize : int
+        максимальное количество хранимых результатов
+
+    Методы
+    -------
+    get():
+        Возвращает результат по ключу или None.
+    put():
+        Сохраняет результат, вытесняя давно не использованные.
+    stats():
+        Возвращает счётчики попаданий, промахов и вытеснений.
+    clear():
+        Очищает кеш и сбрасывает счётчики.
+    """
+
+    def __init__(self, maxsize: int = 100_000) -> None:
+        """Конструктор класса."""
+
+        if maxsize <= 0:
+            raise ValueError('Размер кеша должен быть положительным')
+
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Optional[object]:
+        """Возвращает результат по ключу или None, если его нет в кеше."""
+
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return None
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: object) -> None:
+        """Сохраняет результат, вытесняя давно не использованные."""
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def stats(self) -> CacheStats:
+        """Возвращает счётчики кеша."""
+
+        with self._lock:
+            return CacheStats(hits=self._hits, misses=self._misses,
+                              evictions=self._evictions,
+                              size=len(self._data), maxsize=self.maxsize)
+
+    def clear(self) -> None:
+        """Очищает кеш и сбрасывает счётчики."""
+
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = self._evictions = 0
@@ -0,0 +1,234 @@
+"""Потоковая обработка адресов из CSV или JSONL в нескольких процессах.
+
+Пример запуска:
+
+    python -m region_finder_ru addresses.csv --column address \\
+        --workers 8 --chunk-size 5000 --output results.csv
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import IO, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .region_finder_ru import AddressResult, RegionFinder
+
+RESULT_FIELDS = ('postcodes', 'first_3_postcodes', 'region_names',
+                 'city_names', 'district_names', 'settlement_names',
+                 'has_street', 'is_address', 'error')
+
+
+def _process_chunk(addresses: List[str]) -> List[AddressResult]:
+    """Обрабатывает часть адресов в дочернем процессе."""
+
+    return list(RegionFinder.find_many(addresses))
+
+
+def _result_to_dict(result: AddressResult) -> dict:
+    """Возвращает поля результата для записи в выходной файл."""
+
+    return {
+        'postcodes': result.postcodes,
+        'first_3_postcodes': result.first_3_postcodes,
+        'region_names': result.region_names,
+        'city_names': result.city_names,
+        'district_names': result.district_names,
+        'settlement_names': result.settlement_names,
+        'has_street': result.has_street,
+        'is_address': result.is_address(),
+        'error': result.error,
+    }
+
+
+def _read_records(stream: IO[str], fmt: str,
+                  column: str) -> Tuple[Optional[List[str]],
+                                        Iterator[Tuple[dict, str]]]:
+    """Возвращает имена колонок CSV (для JSONL - None) и итератор
+    пар (исходная запись, адресная строка).
+
+    Некорректная строка JSONL или строка CSV с лишними полями вызывает
+    ValueError с её номером при чтении итератора."""
+
+    if fmt == 'csv':
+        reader = csv.DictReader(stream)
+        fieldnames = list(reader.fieldnames or [])
+        if column not in fieldnames:
+            raise ValueError('В CSV нет колонки {!r}'.format(column))
+
+        def csv_records() -> Iterator[Tuple[dict, str]]:
+            for row in reader:
+                # Лишние поля DictReader складывает под ключ None
+                if None in row:
+                    raise ValueError('Строка {}: полей больше, чем в '
+                                     'заголовке'.format(reader.line_num))
+                yield row, row[column] or ''
+
+        return fieldnames, csv_records()
+
+    def jsonl_records() -> Iterator[Tuple[dict, str]]:
+        for number, line in enumerate(stream, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                raise ValueError(
+                    'Строка {}: некорректный JSON'.format(number)) from None
+            if not isinstance(record, dict):
+                raise ValueError(
+                    'Строка {}: ожидается JSON-объект'.format(number))
+            address = record.get(column) or ''
+            if not isinstance(address, str):
+                raise ValueError('Строка {}: поле {!r} должно быть '
+                                 'строкой'.format(number, column))
+            yield record, address
+
+    return None, jsonl_records()
+
+
+def _chunks(records: Iterator[Tuple[dict, str]],
+            size: int) -> Iterator[List[Tuple[dict, str]]]:
+    """Делит поток записей на части фиксированного размера."""
+
+    while True:
+        chunk = list(islice(records, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _process(chunks: Iterable[List[Tuple[dict, str]]],
+             workers: int) -> Iterator[Tuple[dict, AddressResult]]:
+    """Обрабатывает части в пуле процессов и возвращает результаты
+    в порядке входных записей.
+
+    Одновременно в обработке находится не более двух частей на процесс,
+    поэтому объём памяти не зависит от размера входного файла."""
+
+    if workers <= 1:
+        for chunk in chunks:
+            addresses = [address for _, address in chunk]
+            yield from zip((record for record, _ in chunk),
+                           _process_chunk(addresses))
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        chunks = iter(chunks)
+        while True:
+            while len(pending) < workers * 2:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                future = executor.submit(
+                    _process_chunk, [address for _, address in chunk])
+                pending.append(([record for record, _ in chunk], future))
+            if not pending:
+                return
+            records, future = pending.popleft()
+            yield from zip(records, future.result())
+
+
+def _write_results(stream: IO[str], fmt: str,
+                   fieldnames: Optional[List[str]],
+                   results: Iterable[Tuple[dict, AddressResult]]) -> int:
+    """Записывает результаты и возвращает количество строк."""
+
+    count = 0
+    if fmt == 'csv':
+        writer = csv.DictWriter(
+            stream, fieldnames=fieldnames + [
+                field for field in RESULT_FIELDS
+                if field not in fieldnames])
+        writer.writeheader()
+        for record, result in results:
+            row = dict(record)
+            for field, value in _result_to_dict(result).items():
+                if isinstance(value, list):
+                    value = ';'.join(value)
+                row[field] = value
+            writer.writerow(row)
+            count += 1
+        return count
+
+    for record, result in results:
+        record = dict(record)
+        record.update(_result_to_dict(result))
+        stream.write(json.dumps(record, ensure_ascii=False))
+        stream.write('\n')
+        count += 1
+    return count
+
+
+def _detect_format(path: str) -> str:
+    """Определяет формат по расширению файла."""
+
+    if path.endswith(('.jsonl', '.ndjson')):
+        return 'jsonl'
+    return 'csv'
+
+
+def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog='python -m region_finder_ru',
+        description='Поиск признаков регионов РФ в адресных строках '
+                    'из CSV или JSONL.')
+    parser.add_argument('input', nargs='?', default='-',
+                        help='входной файл (по умолчанию stdin)')
+    parser.add_argument('-o', '--output', default='-',
+                        help='выходной файл (по умолчанию stdout)')
+    parser.add_argument('-f', '--format', choices=('csv', 'jsonl'),
+                        help='формат входных и выходных данных '
+                             '(по умолчанию по расширению файла, иначе csv)')
+    parser.add_argument('-c', '--column', default='address',
+                        help='колонка CSV или поле JSONL с адресом')
+    parser.add_argument('-w', '--workers', type=int,
+                        default=os.cpu_count() or 1,
+                        help='количество процессов')
+    parser.add_argument('-s', '--chunk-size', type=int, default=1000,
+                        help='количество строк в части для одного процесса')
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error('--workers должен быть положительным')
+    if args.chunk_size < 1:
+        parser.error('--chunk-size должен быть положительным')
+    return args
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Точка входа командной строки."""
+
+    args = _parse_args(argv)
+    fmt = args.format or _detect_format(args.input)
+
+    source = (sys.stdin if args.input == '-'
+              else open(args.input, encoding='utf-8', newline=''))
+    target = (sys.stdout if args.output == '-'
+              else open(args.output, 'w', encoding='utf-8', newline=''))
+    started = time.perf_counter()
+    try:
+        try:
+            fieldnames, records = _read_records(source, fmt, args.column)
+            count = _write_results(
+                target, fmt, fieldnames,
+                _process(_chunks(records, args.chunk_size), args.workers))
+        except ValueError as error:
+            print(error, file=sys.stderr)
+            return 2
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+
+    elapsed = time.perf_counter() - started
+    print('Обработано строк: {}, время: {:.2f} с, скорость: {:.0f} строк/с'
+          .format(count, elapsed, count / elapsed if elapsed else 0.0),
+          file=sys.stderr)
+    return 0
@@ -0,0 +1,119 @@
+"""Поиск признаков регионов в колонках pandas и pyarrow.
+
+Каждое уникальное значение колонки обрабатывается один раз пакетным
+методом RegionFinder.find_many, после чего результаты раскладываются
+по строкам колонки средствами pandas или pyarrow (take по индексам
+уникальных значений). Пустые значения (None, NaN, null) дают пустые
+значения во всех колонках результата.
+
+Нужен pandas или pyarrow:
+
+    pip install region_finder_ru[pandas]
+    pip install region_finder_ru[arrow]
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Type
+
+from .cache import ExtractionCache
+from .region_finder_ru import AddressResult, RegionFinder
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+# Колонки результата: первый почтовый индекс, его первые три цифры,
+# первые найденные регион, город, район и поселок, признак адреса
+COLUMNS = ('postcode', 'prefix', 'region', 'city', 'district',
+           'settlement', 'is_address')
+
+
+def _require(module: str, extra: str):
+    """Импортирует необязательную зависимость."""
+
+    try:
+        return import_module(module)
+    except ImportError as error:
+        raise ImportError(
+            'Для работы с колонками нужен пакет {}: pip install '
+            'region_finder_ru[{}]'.format(module.split('.')[0], extra)
+        ) from error
+
+
+def _first(values: List[str]) -> Optional[str]:
+    return values[0] if values else None
+
+
+def _result_row(result: AddressResult) -> tuple:
+    """Возвращает значения колонок COLUMNS для одного результата."""
+
+    return (_first(result.postcodes), _first(result.first_3_postcodes),
+            _first(result.region_names), _first(result.city_names),
+            _first(result.district_names), _first(result.settlement_names),
+            result.is_address())
+
+
+def _extract_unique(addresses: Sequence[str],
+                    finder: Type[RegionFinder] = RegionFinder,
+                    cache: Optional[ExtractionCache] = None
+                    ) -> Dict[str, list]:
+    """Возвращает значения колонок COLUMNS для каждой строки
+    addresses в том же порядке."""
+
+    rows = [_result_row(result)
+            for result in finder.find_many(addresses, cache=cache)]
+    if not rows:
+        return {column: [] for column in COLUMNS}
+    return dict(zip(COLUMNS, map(list, zip(*rows))))
+
+
+def extract_series(series: 'pd.Series',
+                   finder: Type[RegionFinder] = RegionFinder,
+                   cache: Optional[ExtractionCache] = None
+                   ) -> 'pd.DataFrame':
+    """Возвращает DataFrame с колонками COLUMNS и индексом series.
+
+    Строковые колонки имеют тип string, is_address - boolean;
+    для пустых значений series все колонки содержат pd.NA."""
+
+    pd = _require('pandas', 'pandas')
+
+    uniques = pd.unique(series.dropna())
+    positions = pd.Index(uniques).get_indexer(series)
+    columns = _extract_unique([str(value) for value in uniques],
+                              finder, cache)
+
+    # Пустым значениям series соответствует последний элемент - pd.NA
+    positions[positions == -1] = len(uniques)
+
+    data = {}
+    for column in COLUMNS:
+        dtype = 'boolean' if column == 'is_address' else 'string'
+        values = pd.array(columns[column] + [None], dtype=dtype)
+        data[column] = values.take(positions)
+    return pd.DataFrame(data, index=series.index)
+
+
+def extract_arrow(array: 'pa.Array',
+                  finder: Type[RegionFinder] = RegionFinder,
+                  cache: Optional[ExtractionCache] = None) -> 'pa.Table':
+    """Возвращает pyarrow.Table с колонками COLUMNS для строкового
+    массива (Array или ChunkedArray) pyarrow.
+
+    Уникальные значения берутся из dictionary_encode, для null
+    все колонки содержат null."""
+
+    pa = _require('pyarrow', 'arrow')
+    pc = _require('pyarrow.compute', 'arrow')
+
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    encoded = pc.dictionary_encode(array)
+    columns = _extract_unique(encoded.dictionary.to_pylist(), finder, cache)
+
+    data = {}
+    for column in COLUMNS:
+        kind = pa.bool_() if column == 'is_address' else pa.string()
+        values = pa.array(columns[column], type=kind)
+        data[column] = pc.take(values, encoded.indices)
+    return pa.table(data)
@@ -0,0 +1,170 @@
+from array import array
+from typing import Iterable, Iterator, NamedTuple, Optional, Type
+
+from .cache import ExtractionCache
+from .reference import ReferenceData
+from .region_finder_ru import AddressResult, RegionFinder
+
+# Биты колонки flags
+HAS_STREET = 1
+HAS_CITY = 2
+HAS_DISTRICT = 4
+HAS_SETTLEMENT = 8
+IS_ADDRESS = 16
+HAS_ERROR = 32
+
+
+class CompactRow(NamedTuple):
+    """Результат поиска для одной строки в компактном представлении.
+
+    Коды субъектов и почтовый индекс равны 0, если не найдены."""
+
+    postcode: int
+    postcode_region: int
+    name_region: int
+    flags: int
+
+    @property
+    def region(self) -> int:
+        """Код субъекта: по почтовому индексу, иначе по названию."""
+
+        return self.postcode_region or self.name_region
+
+    @property
+    def has_street(self) -> bool:
+        return bool(self.flags & HAS_STREET)
+
+    @property
+    def error(self) -> bool:
+        return bool(self.flags & HAS_ERROR)
+
+    def is_address(self) -> bool:
+        """Возвращает True, если в строке есть адрес, иначе False."""
+
+        return bool(self.flags & IS_ADDRESS)
+
+
+class CompactBatch:
+    """Класс CompactBatch хранит результаты поиска для набора строк
+    в колонках array фиксированного размера - 7 байт на строку
+    независимо от длины адресов и количества найденных названий.
+
+    Для каждой строки сохраняются первый найденный почтовый индекс
+    числом, код субъекта по нему, код субъекта по первому
+    распознанному названию региона и битовые флаги (HAS_STREET,
+    HAS_CITY, HAS_DISTRICT, HAS_SETTLEMENT, IS_ADDRESS, HAS_ERROR).
+    Сами найденные строки не хранятся.
+
+    Атрибуты
+    ----------
+    reference : ReferenceData
+        справочники для перевода индексов и названий в коды субъектов
+    postcodes : array('I')
+        первые почтовые индексы строк
+    postcode_regions : array('B')
+        коды субъектов по почтовым индексам
+    name_regions : array('B')
+        коды субъектов по названиям регионов
+    flags : array('B')
+        битовые флаги признаков адреса
+
+    Методы
+    -------
+    append():
+        Добавляет результат поиска для одной строки.
+    extend():
+        Добавляет результаты поиска для набора строк.
+    nbytes():
+        Возвращает объём памяти, занятый колонками.
+    from_addresses():
+        Ищет признаки регионов в наборе строк и возвращает CompactBatch.
+    """
+
+    __slots__ = ('reference', 'postcodes', 'postcode_regions',
+                 'name_regions', 'flags')
+
+    def __init__(self, reference: Optional[ReferenceData] = None) -> None:
+        """Конструктор класса. Если справочники не переданы,
+        используются справочники, поставляемые с пакетом."""
+
+        self.reference = (ReferenceData.default() if reference is None
+                          else reference)
+        self.postcodes = array('I')
+        self.postcode_regions = array('B')
+        self.name_regions = array('B')
+        self.flags = array('B')
+
+    def __len__(self) -> int:
+        return len(self.flags)
+
+    def __getitem__(self, index: int) -> CompactRow:
+        return CompactRow(self.postcodes[index], self.postcode_regions[index],
+                          self.name_regions[index], self.flags[index])
+
+    def __iter__(self) -> Iterator[CompactRow]:
+        return map(CompactRow, self.postcodes, self.postcode_regions,
+                   self.name_regions, self.flags)
+
+    def append(self, result: AddressResult) -> None:
+        """Добавляет результат поиска для одной строки."""
+
+        postcode = 0
+        postcode_region = 0
+        if result.postcodes:
+            postcode = int(result.postcodes[0])
+            region = self.reference.region_by_postcode(result.postcodes[0])
+            if region is not None:
+                postcode_region = region.code
+
+        name_region = 0
+        for name in result.region_names:
+            region = self.reference.region_by_name(name)
+            if region is not None:
+                name_region = region.code
+                break
+
+        flags = 0
+        if result.has_street:
+            flags |= HAS_STREET
+        if result.city_names:
+            flags |= HAS_CITY
+        if result.district_names:
+            flags |= HAS_DISTRICT
+        if result.settlement_names:
+            flags |= HAS_SETTLEMENT
+        if result.is_address():
+            flags |= IS_ADDRESS
+        if result.error is not None:
+            flags |= HAS_ERROR
+
+        self.postcodes.append(postcode)
+        self.postcode_regions.append(postcode_region)
+        self.name_regions.append(name_region)
+        self.flags.append(flags)
+
+    def extend(self, results: Iterable[AddressResult]) -> None:
+        """Добавляет результаты поиска для набора строк."""
+
+        for result in results:
+            self.append(result)
+
+    def nbytes(self) -> int:
+        """Возвращает объём памяти в байтах, занятый колонками."""
+
+        return sum(column.itemsize * len(column)
+                   for column in (self.postcodes, self.postcode_regions,
+                                  self.name_regions, self.flags))
+
+    @classmethod
+    def from_addresses(cls, addresses: Iterable[str],
+                       finder: Type[RegionFinder] = RegionFinder,
+                       reference: Optional[ReferenceData] = None,
+                       cache: Optional[ExtractionCache] = None
+                       ) -> 'CompactBatch':
+        """Ищет признаки регионов в наборе строк методом
+        finder.find_many и возвращает CompactBatch. Результаты
+        для отдельных строк не накапливаются в памяти."""
+
+        batch = cls(reference)
+        batch.extend(finder.find_many(addresses, cache=cache))
+        return batch
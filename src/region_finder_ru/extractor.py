@@ -0,0 +1,95 @@
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Type
+
+from .cache import ExtractionCache
+from .region_finder_ru import AddressResult, RegionFinder
+
+
+class Extractor:
+    """Класс Extractor - потокобезопасный объект поиска признаков
+    регионов, который создаётся один раз и используется из многих
+    потоков одновременно.
+
+    В отличие от экземпляра RegionFinder, Extractor не хранит адресную
+    строку и промежуточные результаты: каждый вызов работает только
+    с локальными переменными и методами класса finder. Общий кеш
+    ExtractionCache защищён собственной блокировкой. Другой кеш
+    (например, SqliteExtractionCache) должен быть потокобезопасным.
+
+    В сборках CPython без GIL (3.13t и новее) пакетная обработка
+    map масштабируется по ядрам; с GIL потоки выполняют регулярные
+    выражения по очереди, и для параллельной обработки лучше подходит
+    пул процессов (см. python -m region_finder_ru).
+
+    Атрибуты
+    ----------
+    finder : Type[RegionFinder]
+        класс, регулярные выражения которого используются
+    cache : Optional[ExtractionCache]
+        общий кеш результатов
+
+    Методы
+    -------
+    extract():
+        Возвращает результат поиска для одной адресной строки.
+    find_many():
+        Возвращает результаты для набора строк в текущем потоке.
+    map():
+        Возвращает результаты для набора строк, обработанного
+        в пуле потоков.
+    """
+
+    __slots__ = ('finder', 'cache')
+
+    def __init__(self, finder: Type[RegionFinder] = RegionFinder,
+                 cache: Optional[ExtractionCache] = None) -> None:
+        """Конструктор класса."""
+
+        self.finder = finder
+        self.cache = cache
+
+    def extract(self, address: str) -> AddressResult:
+        """Возвращает результат поиска для одной адресной строки."""
+
+        return next(self.finder.find_many([address], cache=self.cache))
+
+    def find_many(self, addresses: Iterable[str]) -> Iterator[AddressResult]:
+        """Возвращает результаты для набора строк в текущем потоке."""
+
+        return self.finder.find_many(addresses, cache=self.cache)
+
+    def _extract_chunk(self, addresses: List[str]) -> List[AddressResult]:
+        return list(self.finder.find_many(addresses, cache=self.cache))
+
+    def map(self, addresses: Iterable[str], workers: Optional[int] = None,
+            chunk_size: int = 1000) -> Iterator[AddressResult]:
+        """Обрабатывает строки частями по chunk_size в пуле из workers
+        потоков (по умолчанию - по количеству процессоров)
+        и возвращает результаты в порядке входных строк.
+
+        Одновременно в обработке не более двух частей на поток,
+        поэтому набор строк может быть потоком неограниченной длины."""
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError('Количество потоков должно быть положительным')
+        if chunk_size < 1:
+            raise ValueError('Размер части должен быть положительным')
+
+        addresses = iter(addresses)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            while True:
+                while len(pending) < workers * 2:
+                    chunk = list(islice(addresses, chunk_size))
+                    if not chunk:
+                        break
+                    pending.append(
+                        executor.submit(self._extract_chunk, chunk))
+                if not pending:
+                    return
+                yield from pending.popleft().result()
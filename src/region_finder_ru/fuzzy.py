@@ -0,0 +1,187 @@
+import csv
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from .gazetteer import GAZETTEER_CSV
+from .reference import REGIONS_CSV
+from .region_finder_ru import RegionFinder
+
+
+class FuzzyMatch(NamedTuple):
+    """Название из справочника, отличающееся от искомого
+    не более чем на distance правок."""
+
+    kind: str
+    name: str
+    code: int
+    distance: int
+
+
+class FuzzyIndex:
+    """Класс FuzzyIndex находит названия из справочника, записанные
+    с опечатками, методом симметричного удаления.
+
+    Для каждого названия заранее вычисляются все варианты с удалёнными
+    символами (не более max_distance). При поиске такие же варианты
+    вычисляются для искомого слова, и расстояние Дамерау-Левенштейна
+    считается только для названий с общими вариантами, поэтому время
+    поиска не зависит от размера справочника.
+
+    Атрибуты
+    ----------
+    max_distance : int
+        максимальное количество правок (вставка, удаление, замена,
+        перестановка соседних символов)
+
+    Методы
+    -------
+    lookup():
+        Возвращает ближайшие названия из справочника.
+    from_csv():
+        Загружает справочник из CSV-файлов.
+    default():
+        Возвращает справочник, поставляемый с пакетом.
+    """
+
+    _default = None
+
+    def __init__(self, entries: Iterable[Tuple[str, str, int]],
+                 max_distance: int = 2) -> None:
+        """Конструктор класса.
+
+        entries - тройки (вид, название, код субъекта), где вид - region,
+        city или settlement. Названия приводятся к виду адресной строки
+        RegionFinder."""
+
+        if max_distance < 0:
+            raise ValueError('Количество правок не может быть '
+                             'отрицательным')
+
+        self.max_distance = max_distance
+        self._entries: List[Tuple[str, str, int]] = []
+        self._deletes: Dict[str, List[int]] = {}
+        # Длина самого длинного названия: более длинные слова
+        # не ищутся, число их вариантов растёт квадратично
+        self._max_length = 0
+        seen = set()
+        for kind, name, code in entries:
+            name = RegionFinder._beatify_address(name).strip()
+            if not name or (kind, name, code) in seen:
+                continue
+            seen.add((kind, name, code))
+            index = len(self._entries)
+            self._entries.append((kind, name, code))
+            self._max_length = max(self._max_length, len(name))
+            for variant in _deletes(name, max_distance):
+                self._deletes.setdefault(variant, []).append(index)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, word: str, kind: Optional[str] = None,
+               max_distance: Optional[int] = None) -> List[FuzzyMatch]:
+        """Возвращает названия вида kind (любого, если не передан),
+        ближайшие к слову word, или пустой список.
+
+        Допустимое количество правок зависит от длины слова: для слов
+        короче 4 символов - 0, короче 8 - 1, иначе - max_distance."""
+
+        allowed = _allowed_distance(len(word), self.max_distance)
+        if max_distance is not None:
+            allowed = min(allowed, max_distance)
+        if len(word) > self._max_length + allowed:
+            return []
+
+        candidates: Set[int] = set()
+        for variant in _deletes(word, allowed):
+            candidates.update(self._deletes.get(variant, ()))
+
+        matches = []
+        best = allowed
+        for index in sorted(candidates):
+            entry_kind, name, code = self._entries[index]
+            if kind is not None and entry_kind != kind:
+                continue
+            if abs(len(name) - len(word)) > best:
+                continue
+            distance = _distance(word, name, best)
+            if distance > best:
+                continue
+            if distance < best:
+                matches = []
+                best = distance
+            matches.append(FuzzyMatch(entry_kind, name, code, distance))
+        return matches
+
+    @classmethod
+    def from_csv(cls, gazetteer_path: str = GAZETTEER_CSV,
+                 regions_path: Optional[str] = REGIONS_CSV,
+                 max_distance: int = 2) -> 'FuzzyIndex':
+        """Загружает справочник из CSV-файлов в форматах
+        Gazetteer.from_csv и ReferenceData.from_csv. Из файла регионов
+        берутся все ключи, в том числе прилагательные."""
+
+        entries = []
+        if regions_path is not None:
+            with open(regions_path, encoding='utf-8', newline='') as stream:
+                for row in csv.DictReader(stream):
+                    entries.extend(('region', key, int(row['code']))
+                                   for key in row['keys'].split('|'))
+        with open(gazetteer_path, encoding='utf-8', newline='') as stream:
+            entries.extend((row['kind'], row['name'], int(row['code']))
+                           for row in csv.DictReader(stream))
+        return cls(entries, max_distance)
+
+    @classmethod
+    def default(cls) -> 'FuzzyIndex':
+        """Возвращает справочник, поставляемый с пакетом.
+        Справочник загружается один раз при первом обращении."""
+
+        if cls._default is None:
+            cls._default = cls.from_csv()
+        return cls._default
+
+
+def _allowed_distance(length: int, max_distance: int) -> int:
+    """Возвращает допустимое количество правок для слова длины length."""
+
+    if length < 4:
+        return 0
+    if length < 8:
+        return min(1, max_distance)
+    return max_distance
+
+
+def _deletes(word: str, distance: int) -> Set[str]:
+    """Возвращает слово и все его варианты без distance
+    или меньшего количества символов."""
+
+    variants = {word}
+    layer = {word}
+    for _ in range(distance):
+        layer = {variant[:position] + variant[position + 1:]
+                 for variant in layer
+                 for position in range(len(variant))}
+        variants |= layer
+    return variants
+
+
+def _distance(first: str, second: str, limit: int) -> int:
+    """Возвращает расстояние Дамерау-Левенштейна (с перестановкой
+    соседних символов) или limit + 1, если оно больше limit."""
+
+    previous2 = None
+    previous = list(range(len(second) + 1))
+    for i in range(1, len(first) + 1):
+        current = [i] + [0] * len(second)
+        for j in range(1, len(second) + 1):
+            cost = first[i - 1] != second[j - 1]
+            current[j] = min(previous[j] + 1, current[j - 1] + 1,
+                             previous[j - 1] + cost)
+            if (previous2 is not None and i > 1 and j > 1
+                    and first[i - 1] == second[j - 2]
+                    and first[i - 2] == second[j - 1]):
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return min(previous[-1], limit + 1)
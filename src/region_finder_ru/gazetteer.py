@@ -0,0 +1,213 @@
+import csv
+import os
+import re
+from collections import deque
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .reference import DATA_DIR, REGIONS_CSV
+from .region_finder_ru import RegionFinder
+
+GAZETTEER_CSV = os.path.join(DATA_DIR, 'gazetteer.csv')
+
+# Окончания прилагательных: такие ключи регионов без статуса
+# ("томская", "алтайский") совпадают с обычными словами адреса
+_ADJECTIVE_ENDINGS = ('ая', 'яя', 'ий', 'ый', 'ой')
+
+# Признак населённого пункта непосредственно перед названием
+_marker_regex = re.compile(
+    r'(?<![\w-])(?:г|гор|город|с|село|п|пос|поселок|пгт|р\.п|н\.п)\.? ?\Z')
+
+# Наибольшая длина признака с точкой и пробелом
+_MARKER_LENGTH = len('поселок. ')
+
+
+class GazetteerMatch(NamedTuple):
+    """Название из справочника, найденное в адресной строке."""
+
+    kind: str
+    name: str
+    code: int
+    start: int
+    end: int
+
+
+class Gazetteer:
+    """Класс Gazetteer ищет в адресной строке все известные названия
+    субъектов РФ, городов и населённых пунктов за один проход
+    автоматом Ахо-Корасик.
+
+    Время поиска линейно зависит от длины строки и не зависит
+    от размера справочника. Названия находятся и без признаков
+    "г.", "с." и т.п. Название засчитывается, только если оно
+    не является частью более длинного слова. Неоднозначные названия,
+    совпадающие с обычными словами, именами или фамилиями (Владимир,
+    Шахты, Орел), засчитываются только после признака "г.", "с." и т.п.
+
+    Методы
+    -------
+    find():
+        Возвращает список найденных названий.
+    codes():
+        Возвращает коды субъектов по названию.
+    from_csv():
+        Загружает справочник из CSV-файлов.
+    default():
+        Возвращает справочник, поставляемый с пакетом.
+    """
+
+    _default = None
+
+    def __init__(self, entries: Iterable[Tuple[str, str, int]],
+                 ambiguous: Iterable[str] = ()) -> None:
+        """Конструктор класса.
+
+        entries - тройки (вид, название, код субъекта), где вид - region,
+        city или settlement. ambiguous - названия, которые засчитываются
+        только после признака населённого пункта. Названия приводятся
+        к виду адресной строки RegionFinder."""
+
+        ambiguous = {RegionFinder._beatify_address(name).strip()
+                     for name in ambiguous}
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        self._entries: List[Tuple[str, str, int, int, bool]] = []
+        self._codes: Dict[Tuple[str, str], List[int]] = {}
+
+        for kind, name, code in entries:
+            name = RegionFinder._beatify_address(name).strip()
+            if not name:
+                continue
+            state = 0
+            for char in name:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(len(self._entries))
+            self._entries.append(
+                (kind, name, code, len(name), name in ambiguous))
+            codes = self._codes.setdefault((kind, name), [])
+            if code not in codes:
+                codes.append(code)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(char, 0)
+                self._fail[next_state] = fail
+                self._output[next_state] = (self._output[next_state]
+                                            + self._output[fail])
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def find(self, address: str) -> List[GazetteerMatch]:
+        """Возвращает список названий, найденных в подготовленной
+        адресной строке (RegionFinder.address).
+
+        Пересекающиеся совпадения разрешаются в пользу самого левого,
+        а из начинающихся в одной позиции - самого длинного. Если одно
+        название относится к нескольким записям справочника,
+        возвращаются все записи."""
+
+        goto, fail, output = self._goto, self._fail, self._output
+        candidates = []
+        state = 0
+        for position, char in enumerate(address):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for index in output[state]:
+                end = position + 1
+                start = end - self._entries[index][3]
+                if (_is_boundary(address, start - 1)
+                        and _is_boundary(address, end)
+                        and (not self._entries[index][4]
+                             or _has_marker(address, start))):
+                    candidates.append((start, -end, index))
+
+        matches = []
+        last_end = -1
+        last_span = None
+        for start, negative_end, index in sorted(candidates):
+            end = -negative_end
+            if (start, end) != last_span:
+                if start < last_end:
+                    continue
+                last_span = (start, end)
+                last_end = end
+            kind, name, code, _, _ = self._entries[index]
+            matches.append(GazetteerMatch(kind, name, code, start, end))
+        return matches
+
+    def codes(self, name: str, kind: str) -> List[int]:
+        """Возвращает коды субъектов, в которых есть объект вида kind
+        с названием name (как его возвращают методы RegionFinder)."""
+
+        return list(self._codes.get((kind, name), ()))
+
+    @classmethod
+    def from_csv(cls, gazetteer_path: str = GAZETTEER_CSV,
+                 regions_path: Optional[str] = REGIONS_CSV) -> 'Gazetteer':
+        """Загружает справочник из CSV-файлов.
+
+        В файле справочника колонки kind, name, code и необязательная
+        колонка needs_marker (1 - название неоднозначно и засчитывается
+        только после признака). Если передан файл регионов в формате
+        ReferenceData.from_csv, из него добавляются официальные названия
+        субъектов и ключи, не являющиеся прилагательными."""
+
+        entries = []
+        ambiguous = []
+        if regions_path is not None:
+            with open(regions_path, encoding='utf-8', newline='') as stream:
+                for row in csv.DictReader(stream):
+                    code = int(row['code'])
+                    entries.append(('region', row['name'], code))
+                    entries.extend(
+                        ('region', key, code)
+                        for key in row['keys'].split('|')
+                        if not key.endswith(_ADJECTIVE_ENDINGS))
+        with open(gazetteer_path, encoding='utf-8', newline='') as stream:
+            for row in csv.DictReader(stream):
+                entries.append((row['kind'], row['name'], int(row['code'])))
+                if row.get('needs_marker') == '1':
+                    ambiguous.append(row['name'])
+        return cls(entries, ambiguous)
+
+    @classmethod
+    def default(cls) -> 'Gazetteer':
+        """Возвращает справочник, поставляемый с пакетом.
+        Справочник загружается один раз при первом обращении."""
+
+        if cls._default is None:
+            cls._default = cls.from_csv()
+        return cls._default
+
+
+def _is_boundary(address: str, position: int) -> bool:
+    """Возвращает True, если в позиции нет буквы, цифры или дефиса,
+    то есть совпадение не является частью более длинного слова."""
+
+    if position < 0 or position >= len(address):
+        return True
+    char = address[position]
+    return not (char.isalnum() or char == '-')
+
+
+def _has_marker(address: str, start: int) -> bool:
+    """Возвращает True, если перед позицией start стоит признак
+    населённого пункта ("г.", "город", "с.", "пгт" и т.п.)."""
+
+    return _marker_regex.search(
+        address, max(0, start - _MARKER_LENGTH), start) is not None
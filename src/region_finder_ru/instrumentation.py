@@ -0,0 +1,371 @@
+"""Замер времени регулярных выражений и методов поиска RegionFinder.
+
+Пока инструментирование включено, регулярные выражения и методы
+поиска класса заменяются обёртками, которые считают вызовы и совпадения
+и замеряют время. После выключения исходные атрибуты возвращаются
+на место, поэтому выключенное инструментирование не замедляет поиск.
+
+    with Instrumentation(RegionFinder) as instrumentation:
+        list(RegionFinder.find_many(addresses))
+    print(prometheus_text(instrumentation.snapshot()))
+"""
+
+import inspect
+import re
+import threading
+from bisect import bisect_left
+from time import perf_counter
+from typing import (Callable, Dict, Iterable, Iterator, List, NamedTuple,
+                    Tuple, Type)
+
+from .region_finder_ru import RegionFinder, _pattern_names
+
+# Верхние границы интервалов гистограммы времени в секундах,
+# последний интервал не ограничен
+HISTOGRAM_BUCKETS = (0.00001, 0.0001, 0.001, 0.01, 0.1, 1.0)
+
+# Методы поиска, которые замеряются наряду с регулярными выражениями
+_method_regex = re.compile(
+    r'_find_\w+|_\w+_in|_are_street_attrs_in_address|is_address')
+
+_MISSING = object()
+
+
+class TimingStats(NamedTuple):
+    """Счётчики одного регулярного выражения или метода."""
+
+    calls: int
+    matches: int
+    total_time: float
+    max_time: float
+    histogram: Tuple[int, ...]
+
+    @property
+    def mean_time(self) -> float:
+        """Среднее время вызова в секундах."""
+
+        return self.total_time / self.calls if self.calls else 0.0
+
+
+class Snapshot(NamedTuple):
+    """Счётчики всех регулярных выражений и методов по именам
+    атрибутов класса."""
+
+    patterns: Dict[str, TimingStats]
+    methods: Dict[str, TimingStats]
+
+
+class _Timer:
+    """Накапливает счётчики одного регулярного выражения или метода."""
+
+    __slots__ = ('_lock', 'calls', 'matches', 'total_time', 'max_time',
+                 'histogram')
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.calls = 0
+        self.matches = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.histogram = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+
+    def record(self, elapsed: float, matches: int) -> None:
+        with self._lock:
+            self.calls += 1
+            self.matches += matches
+            self.total_time += elapsed
+            if elapsed > self.max_time:
+                self.max_time = elapsed
+            self.histogram[bisect_left(HISTOGRAM_BUCKETS, elapsed)] += 1
+
+    def stats(self) -> TimingStats:
+        with self._lock:
+            return TimingStats(self.calls, self.matches, self.total_time,
+                               self.max_time, tuple(self.histogram))
+
+
+class _TimedPattern:
+    """Обёртка откомпилированного регулярного выражения,
+    замеряющая время поиска."""
+
+    __slots__ = ('__wrapped__', 'pattern', 'flags', 'groups', 'groupindex',
+                 '_timer')
+
+    def __init__(self, pattern, timer: _Timer) -> None:
+        self.__wrapped__ = pattern
+        self.pattern = pattern.pattern
+        self.flags = pattern.flags
+        self.groups = pattern.groups
+        self.groupindex = pattern.groupindex
+        self._timer = timer
+
+    def _timed(self, method: str, *args, **kwargs):
+        started = perf_counter()
+        result = getattr(self.__wrapped__, method)(*args, **kwargs)
+        elapsed = perf_counter() - started
+        return result, elapsed
+
+    def search(self, *args, **kwargs):
+        match, elapsed = self._timed('search', *args, **kwargs)
+        self._timer.record(elapsed, match is not None)
+        return match
+
+    def match(self, *args, **kwargs):
+        match, elapsed = self._timed('match', *args, **kwargs)
+        self._timer.record(elapsed, match is not None)
+        return match
+
+    def fullmatch(self, *args, **kwargs):
+        match, elapsed = self._timed('fullmatch', *args, **kwargs)
+        self._timer.record(elapsed, match is not None)
+        return match
+
+    def findall(self, *args, **kwargs) -> list:
+        found, elapsed = self._timed('findall', *args, **kwargs)
+        self._timer.record(elapsed, len(found))
+        return found
+
+    def finditer(self, *args, **kwargs) -> Iterator:
+        """Время замеряется только внутри поиска очередного совпадения,
+        без обработки совпадений вызывающей стороной."""
+
+        iterator = self.__wrapped__.finditer(*args, **kwargs)
+        elapsed = 0.0
+        count = 0
+        try:
+            while True:
+                started = perf_counter()
+                match = next(iterator, None)
+                elapsed += perf_counter() - started
+                if match is None:
+                    return
+                count += 1
+                yield match
+        finally:
+            self._timer.record(elapsed, count)
+
+    def sub(self, *args, **kwargs) -> str:
+        (result, count), elapsed = self._timed('subn', *args, **kwargs)
+        self._timer.record(elapsed, count)
+        return result
+
+    def subn(self, *args, **kwargs) -> Tuple[str, int]:
+        (result, count), elapsed = self._timed('subn', *args, **kwargs)
+        self._timer.record(elapsed, count)
+        return result, count
+
+    def split(self, *args, **kwargs) -> list:
+        parts, elapsed = self._timed('split', *args, **kwargs)
+        self._timer.record(elapsed, len(parts) > 1)
+        return parts
+
+    def __getattr__(self, name: str):
+        return getattr(self.__wrapped__, name)
+
+    def __repr__(self) -> str:
+        return '<timed {!r}>'.format(self.__wrapped__)
+
+
+def _timed_function(function: Callable, timer: _Timer) -> Callable:
+    """Оборачивает функцию замером времени. Совпадением считается
+    непустой результат."""
+
+    def wrapper(*args, **kwargs):
+        started = perf_counter()
+        result = function(*args, **kwargs)
+        timer.record(perf_counter() - started, bool(result))
+        return result
+
+    wrapper.__name__ = function.__name__
+    wrapper.__qualname__ = function.__qualname__
+    wrapper.__doc__ = function.__doc__
+    wrapper.__wrapped__ = function
+    return wrapper
+
+
+class Instrumentation:
+    """Класс Instrumentation считает вызовы и совпадения и замеряет
+    время регулярных выражений и методов поиска класса finder.
+
+    Атрибуты
+    ----------
+    finder : Type[RegionFinder]
+        инструментируемый класс
+    exporters : List[Callable[[Snapshot], None]]
+        получатели счётчиков при вызове export
+
+    Методы
+    -------
+    enable():
+        Заменяет регулярные выражения и методы обёртками.
+    disable():
+        Возвращает исходные регулярные выражения и методы.
+    snapshot():
+        Возвращает текущие счётчики.
+    reset():
+        Обнуляет счётчики.
+    export():
+        Передаёт текущие счётчики всем получателям.
+    """
+
+    def __init__(self, finder: Type[RegionFinder] = RegionFinder,
+                 exporters: Iterable[Callable[[Snapshot], None]] = ()
+                 ) -> None:
+        """Конструктор класса."""
+
+        self.finder = finder
+        self.exporters = list(exporters)
+        self._pattern_timers = {name: _Timer()
+                                for name in _pattern_names(finder)}
+        self._method_timers = {name: _Timer() for name in dir(finder)
+                               if _method_regex.fullmatch(name)
+                               and callable(getattr(finder, name))}
+        self._originals: Dict[str, object] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._originals)
+
+    def enable(self) -> None:
+        """Заменяет атрибуты класса finder обёртками с замером времени.
+
+        Для класса одновременно может быть включено только одно
+        инструментирование."""
+
+        if self.enabled:
+            return
+        names = list(self._pattern_timers) + list(self._method_timers)
+        if any(isinstance(inspect.getattr_static(self.finder, name),
+                          (_TimedPattern, _Instrumented))
+               for name in names):
+            raise RuntimeError('Инструментирование класса {} уже '
+                               'включено'.format(self.finder.__name__))
+        for name in names:
+            self._originals[name] = vars(self.finder).get(name, _MISSING)
+            if name in self._pattern_timers:
+                setattr(self.finder, name, _TimedPattern(
+                    getattr(self.finder, name), self._pattern_timers[name]))
+            else:
+                setattr(self.finder, name, _instrument_method(
+                    inspect.getattr_static(self.finder, name),
+                    self._method_timers[name]))
+
+    def disable(self) -> None:
+        """Возвращает исходные атрибуты класса finder."""
+
+        for name, original in self._originals.items():
+            if original is _MISSING:
+                delattr(self.finder, name)
+            else:
+                setattr(self.finder, name, original)
+        self._originals = {}
+
+    def snapshot(self) -> Snapshot:
+        """Возвращает текущие счётчики."""
+
+        return Snapshot(
+            {name: timer.stats()
+             for name, timer in self._pattern_timers.items()},
+            {name: timer.stats()
+             for name, timer in self._method_timers.items()})
+
+    def reset(self) -> None:
+        """Обнуляет счётчики."""
+
+        for timer in (list(self._pattern_timers.values())
+                      + list(self._method_timers.values())):
+            with timer._lock:
+                timer.reset()
+
+    def export(self) -> None:
+        """Передаёт текущие счётчики всем получателям."""
+
+        snapshot = self.snapshot()
+        for exporter in self.exporters:
+            exporter(snapshot)
+
+    def __enter__(self) -> 'Instrumentation':
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.disable()
+
+
+class _Instrumented:
+    """Метка обёрток методов, установленных Instrumentation."""
+
+    __slots__ = ()
+
+
+class _InstrumentedClassMethod(classmethod, _Instrumented):
+    pass
+
+
+class _InstrumentedStaticMethod(staticmethod, _Instrumented):
+    pass
+
+
+class _InstrumentedFunction(_Instrumented):
+    """Обёртка обычного метода, сохраняющая привязку к экземпляру."""
+
+    __slots__ = ('__wrapped__', '_function')
+
+    def __init__(self, function: Callable, timer: _Timer) -> None:
+        self.__wrapped__ = function
+        self._function = _timed_function(function, timer)
+
+    def __get__(self, instance, owner=None):
+        return self._function.__get__(instance, owner)
+
+
+def _instrument_method(descriptor, timer: _Timer) -> _Instrumented:
+    """Оборачивает метод класса, статический или обычный метод."""
+
+    if isinstance(descriptor, classmethod):
+        return _InstrumentedClassMethod(
+            _timed_function(descriptor.__func__, timer))
+    if isinstance(descriptor, staticmethod):
+        return _InstrumentedStaticMethod(
+            _timed_function(descriptor.__func__, timer))
+    return _InstrumentedFunction(descriptor, timer)
+
+
+def prometheus_text(snapshot: Snapshot,
+                    prefix: str = 'region_finder') -> str:
+    """Возвращает счётчики в текстовом формате Prometheus:
+    гистограммы времени, счётчики совпадений и максимальное время
+    для регулярных выражений и методов."""
+
+    lines: List[str] = []
+    for kind, stats_by_name in (('pattern', snapshot.patterns),
+                                ('method', snapshot.methods)):
+        metric = '{}_{}_seconds'.format(prefix, kind)
+        lines.append('# TYPE {} histogram'.format(metric))
+        for name, stats in sorted(stats_by_name.items()):
+            cumulative = 0
+            bounds = [repr(bound) for bound in HISTOGRAM_BUCKETS]
+            for bound, count in zip(bounds + ['+Inf'], stats.histogram):
+                cumulative += count
+                lines.append('{}_bucket{{name="{}",le="{}"}} {}'.format(
+                    metric, name, bound, cumulative))
+            lines.append('{}_sum{{name="{}"}} {!r}'.format(
+                metric, name, stats.total_time))
+            lines.append('{}_count{{name="{}"}} {}'.format(
+                metric, name, stats.calls))
+
+        metric = '{}_{}_matches_total'.format(prefix, kind)
+        lines.append('# TYPE {} counter'.format(metric))
+        for name, stats in sorted(stats_by_name.items()):
+            lines.append('{}{{name="{}"}} {}'.format(
+                metric, name, stats.matches))
+
+        metric = '{}_{}_max_seconds'.format(prefix, kind)
+        lines.append('# TYPE {} gauge'.format(metric))
+        for name, stats in sorted(stats_by_name.items()):
+            lines.append('{}{{name="{}"}} {!r}'.format(
+                metric, name, stats.max_time))
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,210 @@
+"""Компактный двоичный формат справочников для ReferenceData,
+который открывается через mmap только на чтение.
+
+Несколько процессов, открывших один файл, используют одну копию
+страниц в кеше операционной системы, а открытие файла не требует
+разбора CSV.
+
+Формат (все числа little-endian):
+
+    заголовок      8s магическая строка, I число исключений,
+                   I число названий, I размер блока строк
+    индексы        1000 байт - код субъекта по первым трём цифрам индекса
+    регионы        256 записей (I смещение, I длина) названия субъекта
+                   в блоке строк по коду субъекта, длина 0 - нет субъекта
+    исключения     записи (I начало, I конец, B код, 3x), по возрастанию
+                   начала диапазона
+    названия       записи (I смещение, I длина, B код, 3x), по возрастанию
+                   названия в UTF-8
+    строки         названия в UTF-8
+
+Сборка файла из CSV:
+
+    python -m region_finder_ru.mapped reference.bin \\
+        [regions.csv postcodes.csv]
+"""
+
+import mmap
+import struct
+import sys
+from typing import Dict, Optional, Sequence
+
+from .reference import POSTCODES_CSV, REGIONS_CSV, ReferenceData, Region
+
+MAGIC = b'RFRUREF1'
+_HEADER = struct.Struct('<8sIII')
+_SLOT = struct.Struct('<II')
+_RECORD = struct.Struct('<IIB3x')
+_PREFIXES = 1000
+_CODES = 256
+
+
+def compile_reference(output_path: str,
+                      regions_path: str = REGIONS_CSV,
+                      postcodes_path: str = POSTCODES_CSV) -> None:
+    """Собирает двоичный файл справочников из CSV-файлов
+    в формате ReferenceData.from_csv."""
+
+    reference = ReferenceData.from_csv(regions_path, postcodes_path)
+    strings = bytearray()
+
+    def add_string(value: str):
+        encoded = value.encode('utf-8')
+        offset = len(strings)
+        strings.extend(encoded)
+        return offset, len(encoded)
+
+    slots = [(0, 0)] * _CODES
+    for code, region in reference._regions.items():
+        if not 0 < code < _CODES:
+            raise ValueError('Код субъекта вне диапазона: {}'.format(code))
+        slots[code] = add_string(region.name)
+
+    names = sorted((name.encode('utf-8'), code)
+                   for name, code in reference._by_name.items())
+    name_records = []
+    for encoded, code in names:
+        offset = len(strings)
+        strings.extend(encoded)
+        name_records.append(_RECORD.pack(offset, len(encoded), code))
+
+    with open(output_path, 'wb') as stream:
+        stream.write(_HEADER.pack(MAGIC, len(reference._exceptions),
+                                  len(name_records), len(strings)))
+        stream.write(bytes(reference._by_prefix))
+        for slot in slots:
+            stream.write(_SLOT.pack(*slot))
+        for start, end, code in reference._exceptions:
+            stream.write(_RECORD.pack(start, end, code))
+        stream.write(b''.join(name_records))
+        stream.write(bytes(strings))
+
+
+class MappedReferenceData:
+    """Класс MappedReferenceData - справочники почтовых индексов
+    и названий регионов, открытые через mmap из файла,
+    собранного compile_reference.
+
+    Методы совпадают с методами ReferenceData, поэтому объект можно
+    передать в InMemoryRegionFinder вместо ReferenceData.
+
+    Методы
+    -------
+    region_by_code():
+        Возвращает регион по коду субъекта.
+    region_by_prefix():
+        Возвращает регион по первым трём цифрам почтового индекса.
+    region_by_postcode():
+        Возвращает регион по шестизначному почтовому индексу.
+    region_by_name():
+        Возвращает регион по названию, найденному _find_region_names.
+    close():
+        Закрывает файл.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Конструктор класса."""
+
+        with open(path, 'rb') as stream:
+            self._data = mmap.mmap(stream.fileno(), 0,
+                                   access=mmap.ACCESS_READ)
+        magic, self._exception_count, self._name_count, strings_size = (
+            _HEADER.unpack_from(self._data, 0))
+        if magic != MAGIC:
+            self._data.close()
+            raise ValueError('Файл {} не является файлом справочников'
+                             .format(path))
+        self._prefixes = _HEADER.size
+        self._slots = self._prefixes + _PREFIXES
+        self._exceptions = self._slots + _CODES * _SLOT.size
+        self._names = self._exceptions + self._exception_count * _RECORD.size
+        self._strings = self._names + self._name_count * _RECORD.size
+        if len(self._data) != self._strings + strings_size:
+            self._data.close()
+            raise ValueError('Файл {} повреждён'.format(path))
+        self._regions: Dict[int, Region] = {}
+
+    def __enter__(self) -> 'MappedReferenceData':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Закрывает файл."""
+
+        self._data.close()
+
+    def region_by_code(self, code: int) -> Optional[Region]:
+        """Возвращает регион по коду субъекта."""
+
+        if not 0 < code < _CODES:
+            return None
+        region = self._regions.get(code)
+        if region is None:
+            offset, length = _SLOT.unpack_from(
+                self._data, self._slots + code * _SLOT.size)
+            if not length:
+                return None
+            start = self._strings + offset
+            region = self._regions[code] = Region(
+                code, self._data[start:start + length].decode('utf-8'))
+        return region
+
+    def region_by_prefix(self, prefix: str) -> Optional[Region]:
+        """Возвращает регион по первым трём цифрам почтового индекса."""
+
+        return self.region_by_code(self._data[self._prefixes + int(prefix)])
+
+    def region_by_postcode(self, postcode: str) -> Optional[Region]:
+        """Возвращает регион по шестизначному почтовому индексу."""
+
+        value = int(postcode)
+        low, high = 0, self._exception_count
+        while low < high:
+            middle = (low + high) // 2
+            start, end, code = _RECORD.unpack_from(
+                self._data, self._exceptions + middle * _RECORD.size)
+            if value < start:
+                high = middle
+            elif value > end:
+                low = middle + 1
+            else:
+                return self.region_by_code(code)
+        return self.region_by_code(
+            self._data[self._prefixes + value // 1000])
+
+    def region_by_name(self, name: str) -> Optional[Region]:
+        """Возвращает регион по названию, найденному _find_region_names."""
+
+        encoded = name.encode('utf-8')
+        low, high = 0, self._name_count
+        while low < high:
+            middle = (low + high) // 2
+            offset, length, code = _RECORD.unpack_from(
+                self._data, self._names + middle * _RECORD.size)
+            start = self._strings + offset
+            current = self._data[start:start + length]
+            if encoded < current:
+                high = middle
+            elif encoded > current:
+                low = middle + 1
+            else:
+                return self.region_by_code(code)
+        return None
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Собирает двоичный файл справочников из командной строки."""
+
+    args = list(sys.argv[1:] if argv is None else argv)
+    if len(args) not in (1, 3):
+        print('Использование: python -m region_finder_ru.mapped '
+              'reference.bin [regions.csv postcodes.csv]', file=sys.stderr)
+        return 2
+    compile_reference(*args)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""Таблица падежных форм названий субъектов РФ."""
+
+import csv
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+# Окончания падежей (именительный, родительный, дательный, винительный,
+# творительный, предложный) по окончанию именительного падежа.
+# Порядок важен: проверяются сверху вниз.
+_ENDINGS = (
+    ('ая', ('ая', 'ой', 'ой', 'ую', 'ой', 'ой')),
+    ('ий', ('ий', 'ого', 'ому', 'ий', 'им', 'ом')),
+    ('ия', ('ия', 'ии', 'ии', 'ию', 'ией', 'ии')),
+    ('ея', ('ея', 'еи', 'ее', 'ею', 'еей', 'ее')),
+    ('ье', ('ье', 'ья', 'ью', 'ье', 'ьем', 'ье')),
+    ('ня', ('ня', 'ни', 'не', 'ню', 'ней', 'не')),
+    ('а', ('а', 'ы', 'е', 'у', 'ой', 'е')),
+    ('ь', ('ь', 'я', 'ю', 'ь', 'ем', 'е')),
+    ('й', ('й', 'я', 'ю', 'й', 'ем', 'е')),
+)
+
+# Окончания для согласной на конце слова (татарстан, крым)
+_CONSONANT = ('', 'а', 'у', '', 'ом', 'е')
+
+# Несклоняемые слова
+_INDECLINABLE = frozenset(('коми', 'марий', 'эл', 'саха', 'ханты'))
+
+# Слова, склонение которых не определяется окончанием
+_IRREGULAR = {
+    'кубань': ('кубань', 'кубани', 'кубани', 'кубань', 'кубанью', 'кубани'),
+}
+
+
+def decline_word(word: str) -> List[str]:
+    """Возвращает формы слова в шести падежах.
+
+    В словах через дефис склоняется только последняя часть
+    (ханты-мансийский - ханты-мансийского)."""
+
+    head, hyphen, word = word.rpartition('-')
+    prefix = head + hyphen
+    if word in _IRREGULAR:
+        return [prefix + form for form in _IRREGULAR[word]]
+    if word in _INDECLINABLE:
+        return [prefix + word] * 6
+    for ending, forms in _ENDINGS:
+        if word.endswith(ending):
+            stem = word[:-len(ending)]
+            return [prefix + stem + form for form in forms]
+    if word[-1:] in 'бвгджзклмнпрстфхцчшщ':
+        return [prefix + word + form for form in _CONSONANT]
+    return [prefix + word] * 6
+
+
+def decline_phrase(phrase: str) -> List[str]:
+    """Возвращает формы названия из нескольких слов в шести падежах
+    (северная осетия - северной осетии)."""
+
+    words = [decline_word(word) for word in phrase.split()]
+    return [' '.join(forms) for forms in zip(*words)]
+
+
+@lru_cache(maxsize=None)
+def region_inflections(regions_path: Optional[str] = None) -> Dict[str, str]:
+    """Возвращает словарь: падежная форма названия субъекта -
+    название в именительном падеже, как его возвращает
+    RegionFinder._find_region_names.
+
+    Названия берутся из колонки keys файла регионов в формате
+    ReferenceData.from_csv (по умолчанию - из файла пакета)."""
+
+    if regions_path is None:
+        from .reference import REGIONS_CSV
+        regions_path = REGIONS_CSV
+
+    inflections = {}
+    with open(regions_path, encoding='utf-8', newline='') as stream:
+        for row in csv.DictReader(stream):
+            for key in row['keys'].split('|'):
+                for form in decline_phrase(key):
+                    inflections.setdefault(form, key)
+    return inflections
+
+
+@lru_cache(maxsize=None)
+def inflections_version(regions_path: Optional[str] = None) -> str:
+    """Возвращает хеш таблицы region_inflections. Хеш меняется
+    при изменении файла регионов и правил склонения."""
+
+    import hashlib
+
+    digest = hashlib.sha1()
+    for form, key in sorted(region_inflections(regions_path).items()):
+        digest.update('{}:{}\n'.format(form, key).encode('utf-8'))
+    return digest.hexdigest()
@@ -0,0 +1,30 @@
+"""Подготовка адресной строки к поиску регулярными выражениями."""
+
+# Мягкий перенос и символы нулевой ширины удаляются из строки.
+# Пробельные символы Юникода (неразрывный пробел, табуляция и т.п.)
+# обрабатывает str.split() без аргументов.
+_DELETED = '\u00ad\u200b\u200c\u200d\u2060\ufeff'
+
+# Кавычки заменяются пробелом, чтобы не склеивать соседние слова
+_QUOTES = '\u00ab\u00bb\u201e\u201c\u201d\u201f"'
+
+# Дефисы и тире приводятся к дефису-минусу
+_DASHES = '\u2010\u2011\u2012\u2013\u2014\u2015\u2212\ufe58\ufe63\uff0d'
+
+_TABLE = str.maketrans(
+    dict(dict.fromkeys(_DELETED, None), **dict.fromkeys(_QUOTES, ' '),
+         ё='е', **dict.fromkeys(_DASHES, '-')))
+
+
+def normalize_address(address: str) -> str:
+    """Приводит адресную строку к виду, ожидаемому регулярными
+    выражениями RegionFinder.
+
+    Строка переводится в нижний регистр, затем за один проход по таблице
+    перевода буква ё заменяется на е, все виды дефисов и тире - на дефис,
+    кавычки - на пробел, а мягкие переносы и символы нулевой ширины
+    удаляются. Любые последовательности пробельных символов Юникода
+    (в том числе неразрывных пробелов) заменяются одним пробелом,
+    пробелы в начале и в конце строки удаляются."""
+
+    return ' '.join(address.lower().translate(_TABLE).split())
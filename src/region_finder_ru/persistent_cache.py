@@ -0,0 +1,123 @@
+import json
+import sqlite3
+from typing import Optional, Tuple
+
+from .cache import CacheStats
+from .region_finder_ru import AddressResult
+
+
+class SqliteExtractionCache:
+    """Класс SqliteExtractionCache - постоянный кеш результатов поиска
+    в файле SQLite с тем же интерфейсом, что и у ExtractionCache.
+
+    Ключ записи - версия класса поиска (RegionFinder.patterns_version())
+    и подготовленная адресная строка. При обновлении пакета, изменении
+    регулярных выражений или таблиц названий регионов меняется версия,
+    и старые записи перестают находиться.
+
+    Атрибуты
+    ----------
+    path : str
+        путь к файлу базы данных
+    commit_every : int
+        количество записей, после которого выполняется фиксация транзакции
+
+    Методы
+    -------
+    get():
+        Возвращает результат по ключу или None.
+    put():
+        Сохраняет результат.
+    stats():
+        Возвращает счётчики попаданий и промахов.
+    purge():
+        Удаляет записи всех версий, кроме указанной.
+    clear():
+        Удаляет все записи и сбрасывает счётчики.
+    close():
+        Фиксирует изменения и закрывает базу данных.
+    """
+
+    def __init__(self, path: str, commit_every: int = 1000) -> None:
+        """Конструктор класса."""
+
+        self.path = path
+        self.commit_every = commit_every
+        self._connection = sqlite3.connect(path)
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS results ('
+            'version TEXT NOT NULL, '
+            'address TEXT NOT NULL, '
+            'result TEXT NOT NULL, '
+            'PRIMARY KEY (version, address)) WITHOUT ROWID')
+        self._pending = 0
+        self._hits = 0
+        self._misses = 0
+
+    def __enter__(self) -> 'SqliteExtractionCache':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute(
+            'SELECT COUNT(*) FROM results').fetchone()[0]
+
+    def get(self, key: Tuple[str, str]) -> Optional[AddressResult]:
+        """Возвращает результат по ключу (версия, адрес) или None."""
+
+        row = self._connection.execute(
+            'SELECT result FROM results WHERE version = ? AND address = ?',
+            key).fetchone()
+        if row is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        return AddressResult(*json.loads(row[0]))
+
+    def put(self, key: Tuple[str, str], value: AddressResult) -> None:
+        """Сохраняет результат по ключу (версия, адрес)."""
+
+        self._connection.execute(
+            'INSERT OR REPLACE INTO results (version, address, result) '
+            'VALUES (?, ?, ?)',
+            (key[0], key[1], json.dumps(value, ensure_ascii=False)))
+        self._pending += 1
+        if self._pending >= self.commit_every:
+            self.commit()
+
+    def commit(self) -> None:
+        """Фиксирует сохранённые результаты."""
+
+        self._connection.commit()
+        self._pending = 0
+
+    def stats(self) -> CacheStats:
+        """Возвращает счётчики кеша. Вытеснений в постоянном кеше нет,
+        а размер ограничен только местом на диске (maxsize равен 0)."""
+
+        return CacheStats(hits=self._hits, misses=self._misses,
+                          evictions=0, size=len(self), maxsize=0)
+
+    def purge(self, version: str) -> int:
+        """Удаляет записи всех версий, кроме указанной,
+        и возвращает их количество."""
+
+        cursor = self._connection.execute(
+            'DELETE FROM results WHERE version != ?', (version,))
+        self.commit()
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        """Удаляет все записи и сбрасывает счётчики."""
+
+        self._connection.execute('DELETE FROM results')
+        self.commit()
+        self._hits = self._misses = 0
+
+    def close(self) -> None:
+        """Фиксирует изменения и закрывает базу данных."""
+
+        self.commit()
+        self._connection.close()
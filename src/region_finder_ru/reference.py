@@ -0,0 +1,361 @@
+import csv
+import os
+from array import array
+from bisect import bisect_right
+from typing import (TYPE_CHECKING, Dict, Iterable, List, NamedTuple,
+                    Optional, Tuple)
+
+from .cache import ExtractionCache
+from .region_finder_ru import RegionFinder
+
+if TYPE_CHECKING:
+    from .fuzzy import FuzzyIndex
+    from .gazetteer import Gazetteer, GazetteerMatch
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+REGIONS_CSV = os.path.join(DATA_DIR, 'regions.csv')
+POSTCODES_CSV = os.path.join(DATA_DIR, 'postcodes.csv')
+
+
+class Region(NamedTuple):
+    """Субъект Российской Федерации."""
+
+    code: int
+    name: str
+
+
+class Resolution(NamedTuple):
+    """Результат поэтапного определения региона.
+
+    region - регион с наибольшей уверенностью или None (если признаков
+    нет или у нескольких субъектов одинаковая наибольшая уверенность),
+    confidence - наибольшая уверенность, tier - ступень, на которой
+    регион определён (None, если порог не достигнут или признаки
+    противоречат друг другу), scores - уверенность по кодам всех
+    найденных субъектов."""
+
+    region: Optional[Region]
+    confidence: float
+    tier: Optional[str]
+    stages_run: int
+    stages_skipped: int
+    scores: Dict[int, float]
+
+
+class ReferenceData:
+    """Класс ReferenceData хранит в памяти справочники почтовых индексов
+    и названий субъектов РФ.
+
+    Почтовые индексы ищутся по таблице из 1000 ячеек, индексом в которой
+    служат первые три цифры индекса. Диапазоны полных шестизначных
+    индексов, регион которых отличается от региона по первым трём цифрам,
+    ищутся двоичным поиском. Названия регионов ищутся в словаре.
+
+    Методы
+    -------
+    region_by_code():
+        Возвращает регион по коду субъекта.
+    region_by_prefix():
+        Возвращает регион по первым трём цифрам почтового индекса.
+    region_by_postcode():
+        Возвращает регион по шестизначному почтовому индексу.
+    region_by_name():
+        Возвращает регион по названию, найденному _find_region_names.
+    from_csv():
+        Загружает справочники из CSV-файлов.
+    default():
+        Возвращает справочники, поставляемые с пакетом.
+    """
+
+    _default = None
+
+    def __init__(self, regions: Iterable[Tuple[int, str, Iterable[str]]],
+                 postcodes: Iterable[Tuple[str, str, int]]) -> None:
+        """Конструктор класса.
+
+        regions - тройки (код субъекта, название, ключи для поиска
+        по названию); postcodes - тройки (начало диапазона, конец
+        диапазона, код субъекта), где границы - первые три цифры индекса
+        или полный шестизначный индекс."""
+
+        self._regions: Dict[int, Region] = {}
+        self._by_name: Dict[str, int] = {}
+        for code, name, keys in regions:
+            self._regions[code] = Region(code, name)
+            for key in keys:
+                self._by_name[key] = code
+
+        self._by_prefix = array('B', bytes(1000))
+        exceptions = []
+        for start, end, code in postcodes:
+            if code not in self._regions:
+                raise ValueError('Неизвестный код субъекта: {}'.format(code))
+            if len(start) == 3 and len(end) == 3:
+                for prefix in range(int(start), int(end) + 1):
+                    self._by_prefix[prefix] = code
+            elif len(start) == 6 and len(end) == 6:
+                exceptions.append((int(start), int(end), code))
+            else:
+                raise ValueError('Некорректный диапазон индексов: '
+                                 '{}-{}'.format(start, end))
+        exceptions.sort()
+        self._exception_starts = [start for start, _, _ in exceptions]
+        self._exceptions = exceptions
+
+    def region_by_code(self, code: int) -> Optional[Region]:
+        """Возвращает регион по коду субъекта."""
+
+        return self._regions.get(code)
+
+    def region_by_prefix(self, prefix: str) -> Optional[Region]:
+        """Возвращает регион по первым трём цифрам почтового индекса."""
+
+        return self._regions.get(self._by_prefix[int(prefix)])
+
+    def region_by_postcode(self, postcode: str) -> Optional[Region]:
+        """Возвращает регион по шестизначному почтовому индексу."""
+
+        value = int(postcode)
+        position = bisect_right(self._exception_starts, value) - 1
+        if position >= 0:
+            _, end, code = self._exceptions[position]
+            if value <= end:
+                return self._regions[code]
+        return self._regions.get(self._by_prefix[value // 1000])
+
+    def region_by_name(self, name: str) -> Optional[Region]:
+        """Возвращает регион по названию, найденному _find_region_names."""
+
+        return self._regions.get(self._by_name.get(name, 0))
+
+    @classmethod
+    def from_csv(cls, regions_path: str = REGIONS_CSV,
+                 postcodes_path: str = POSTCODES_CSV) -> 'ReferenceData':
+        """Загружает справочники из CSV-файлов.
+
+        В файле регионов колонки code, name и keys (ключи через |),
+        в файле индексов - колонки start, end и code."""
+
+        with open(regions_path, encoding='utf-8', newline='') as stream:
+            regions = [(int(row['code']), row['name'],
+                        row['keys'].split('|'))
+                       for row in csv.DictReader(stream)]
+        with open(postcodes_path, encoding='utf-8', newline='') as stream:
+            postcodes = [(row['start'], row['end'], int(row['code']))
+                         for row in csv.DictReader(stream)]
+        return cls(regions, postcodes)
+
+    @classmethod
+    def default(cls) -> 'ReferenceData':
+        """Возвращает справочники, поставляемые с пакетом.
+        Справочники загружаются один раз при первом обращении."""
+
+        if cls._default is None:
+            cls._default = cls.from_csv()
+        return cls._default
+
+
+class InMemoryRegionFinder(RegionFinder):
+    """Класс InMemoryRegionFinder определяет регионы по справочникам
+    в памяти без обращения к БД.
+
+    Атрибуты
+    ----------
+    reference : ReferenceData
+        справочники почтовых индексов и названий регионов
+    gazetteer : Gazetteer
+        необязательный справочник названий субъектов, городов
+        и населённых пунктов
+    fuzzy : FuzzyIndex
+        необязательный справочник для поиска названий с опечатками
+
+    Методы
+    -------
+    _find_gazetteer_names():
+        Ищет известные названия из справочника gazetteer.
+    define_regions():
+        Возвращает список регионов, найденных в адресной строке.
+    resolve():
+        Определяет регион по ступеням в порядке их стоимости.
+    warm_up():
+        Заранее компилирует регулярные выражения и загружает
+        справочники пакета.
+    """
+
+    __slots__ = ('reference', 'gazetteer', 'fuzzy')
+
+    # Ступени resolve в порядке возрастания стоимости: имя ступени,
+    # метод, возвращающий коды субъектов по каждому найденному признаку,
+    # и вес признака. Признак, подходящий нескольким субъектам,
+    # делит вес между ними.
+    _resolution_tiers = (
+        ('postcode', '_postcode_codes', 0.9),
+        ('region', '_region_name_codes', 0.8),
+        ('city', '_city_codes', 0.6),
+        ('district', '_district_codes', 0.3),
+        ('settlement', '_settlement_codes', 0.5),
+    )
+
+    def __init__(self, address: str,
+                 cache: Optional[ExtractionCache] = None,
+                 reference: Optional[ReferenceData] = None,
+                 gazetteer: Optional['Gazetteer'] = None,
+                 fuzzy: Optional['FuzzyIndex'] = None) -> None:
+        """Конструктор класса. Если справочники не переданы,
+        используются справочники, поставляемые с пакетом. Вместо
+        ReferenceData можно передать MappedReferenceData."""
+
+        super().__init__(address, cache=cache)
+        self.reference = (ReferenceData.default() if reference is None
+                          else reference)
+        self.gazetteer = gazetteer
+        self.fuzzy = fuzzy
+
+    @classmethod
+    def warm_up(cls) -> None:
+        """Заранее компилирует регулярные выражения и загружает
+        справочники ReferenceData, поставляемые с пакетом."""
+
+        super().warm_up()
+        ReferenceData.default()
+
+    def _find_gazetteer_names(self) -> List['GazetteerMatch']:
+        """Возвращает названия из справочника gazetteer,
+        найденные в строке, или пустой список без справочника."""
+
+        if self.gazetteer is None:
+            return []
+        return self.gazetteer.find(self.address)
+
+    def define_regions(self) -> List[Region]:
+        """Возвращает список регионов без повторов в порядке
+        их нахождения: сначала по почтовым индексам,
+        затем по названиям регионов, затем по названиям
+        из справочника gazetteer, если он передан.
+
+        Если передан справочник fuzzy, названия регионов, городов
+        и поселков, найденные регулярными выражениями, но не найденные
+        в справочниках точно, ищутся в нём с опечатками."""
+
+        regions = []
+        for postcode in self._find_postcodes():
+            region = self.reference.region_by_postcode(postcode)
+            if region is not None and region not in regions:
+                regions.append(region)
+        for codes in self._region_name_codes():
+            for code in codes:
+                region = self.reference.region_by_code(code)
+                if region is not None and region not in regions:
+                    regions.append(region)
+        for match in self._find_gazetteer_names():
+            region = self.reference.region_by_code(match.code)
+            if region is not None and region not in regions:
+                regions.append(region)
+        if self.fuzzy is not None:
+            for codes in self._city_codes() + self._settlement_codes():
+                for code in codes:
+                    region = self.reference.region_by_code(code)
+                    if region is not None and region not in regions:
+                        regions.append(region)
+        return regions
+
+    def _postcode_codes(self) -> List[List[int]]:
+        """Возвращает коды субъектов по почтовым индексам."""
+
+        codes = []
+        for postcode in self._find_postcodes():
+            region = self.reference.region_by_postcode(postcode)
+            if region is not None:
+                codes.append([region.code])
+        return codes
+
+    def _exact_codes(self, name: str, kind: str) -> List[int]:
+        """Возвращает коды субъектов по точному названию: регионов -
+        из reference, остальных объектов - из справочника gazetteer."""
+
+        if kind == 'region':
+            region = self.reference.region_by_name(name)
+            return [] if region is None else [region.code]
+        if self.gazetteer is None:
+            return []
+        return self.gazetteer.codes(name, kind)
+
+    def _name_codes(self, names: List[str], kind: str) -> List[List[int]]:
+        """Возвращает коды субъектов по каждому названию, которое
+        найдено точно или, если передан справочник fuzzy,
+        с опечатками."""
+
+        result = []
+        for name in names:
+            codes = self._exact_codes(name, kind)
+            if not codes and self.fuzzy is not None:
+                codes = sorted({match.code
+                                for match in self.fuzzy.lookup(name, kind)})
+            if codes:
+                result.append(codes)
+        return result
+
+    def _region_name_codes(self) -> List[List[int]]:
+        """Возвращает коды субъектов по названиям регионов."""
+
+        return self._name_codes(self._find_region_names(), 'region')
+
+    def _city_codes(self) -> List[List[int]]:
+        """Возвращает коды субъектов по названиям городов."""
+
+        if self.gazetteer is None and self.fuzzy is None:
+            return []
+        return self._name_codes(self._find_city_names(), 'city')
+
+    def _district_codes(self) -> List[List[int]]:
+        """Возвращает коды субъектов по названиям районов."""
+
+        if self.gazetteer is None and self.fuzzy is None:
+            return []
+        return self._name_codes(self._find_district_names(), 'district')
+
+    def _settlement_codes(self) -> List[List[int]]:
+        """Возвращает коды субъектов по названиям поселков и сел."""
+
+        if self.gazetteer is None and self.fuzzy is None:
+            return []
+        return self._name_codes(self._find_settlement_names(), 'settlement')
+
+    def resolve(self, threshold: float = 0.85) -> Resolution:
+        """Определяет регион по ступеням _resolution_tiers
+        от дешёвых к дорогим и останавливается, как только
+        уверенность одного субъекта достигает threshold и превышает
+        уверенность любого другого субъекта.
+
+        Уверенность субъекта - вероятность того, что верен хотя бы
+        один подтверждающий его признак: 1 - (1 - w1) * (1 - w2) * ...
+        Ступени городов, районов и поселков без справочников
+        gazetteer и fuzzy не находят признаков."""
+
+        if not 0 < threshold <= 1:
+            raise ValueError('Порог уверенности должен быть в (0, 1]')
+
+        scores: Dict[int, float] = {}
+        best_code, best_score, runner_up = None, 0.0, 0.0
+        stages = len(self._resolution_tiers)
+        for stage, (tier, method, weight) in enumerate(
+                self._resolution_tiers, 1):
+            for codes in getattr(self, method)():
+                share = weight / len(codes)
+                for code in codes:
+                    scores[code] = 1 - (1 - scores.get(code, 0.0)) * (
+                        1 - share)
+            if scores:
+                best_code = max(scores, key=scores.get)
+                best_score = scores[best_code]
+                runner_up = max((score for code, score in scores.items()
+                                 if code != best_code), default=0.0)
+            if best_score >= threshold and best_score > runner_up:
+                return Resolution(self.reference.region_by_code(best_code),
+                                  best_score, tier, stage, stages - stage,
+                                  scores)
+
+        # При равной наибольшей уверенности регион не определён
+        region = (None if best_code is None or best_score == runner_up
+                  else self.reference.region_by_code(best_code))
+        return Resolution(region, best_score, None, stages, 0, scores)
@@ -1,6 +1,86 @@
 import re
 from abc import ABC, abstractmethod
-from typing import List
+from functools import lru_cache, wraps
+from typing import (Dict, Iterable, Iterator, List, NamedTuple, Optional,
+                    Set, Tuple)
+
+from . import __version__ as _package_version
+from .cache import ExtractionCache
+from .morphology import inflections_version, region_inflections
+from .normalization import normalize_address
+
+_Pattern = type(re.compile(''))
+_digit_regex = re.compile(r'\d')
+
+
+class _LazyPattern:
+    """Регулярное выражение - атрибут класса, которое компилируется
+    при первом обращении, а не при импорте модуля.
+
+    Обращение к атрибуту возвращает откомпилированное выражение,
+    поэтому для наследников и вызывающего кода оно не отличается
+    от атрибута, заданного через re.compile."""
+
+    __slots__ = ('source', 'flags', '_compiled')
+
+    def __init__(self, source: str, flags: int = 0) -> None:
+        self.source = source
+        self.flags = flags
+        self._compiled = None
+
+    def __get__(self, instance, owner=None):
+        if self._compiled is None:
+            self._compiled = re.compile(self.source, self.flags)
+        return self._compiled
+
+
+def _memoized(method):
+    """Кеширует результат метода в экземпляре класса RegionFinder.
+
+    Результат хранится в словаре _memo экземпляра под именем метода,
+    поэтому не передаётся между экземплярами и сбрасывается при смене
+    адресной строки. Списки возвращаются копиями, чтобы изменение
+    результата вызывающей стороной не портило кеш."""
+
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self):
+        try:
+            value = self._memo[name]
+        except KeyError:
+            value = self._memo[name] = method(self)
+        if isinstance(value, list):
+            return list(value)
+        return value
+
+    return wrapper
+
+
+class AddressResult(NamedTuple):
+    """Результат поиска признаков регионов в одной адресной строке.
+
+    Для пустой строки списки пусты, а в error записан текст ошибки."""
+
+    address: str
+    postcodes: List[str]
+    first_3_postcodes: List[str]
+    region_names: List[str]
+    city_names: List[str]
+    district_names: List[str]
+    settlement_names: List[str]
+    has_street: bool
+    error: Optional[str] = None
+
+    def is_address(self) -> bool:
+        """Возвращает True, если в строке есть адрес, иначе False."""
+
+        return (self.has_street
+                or len(self.region_names) > 0
+                or len(self.first_3_postcodes) > 0
+                or len(self.city_names) > 0
+                or len(self.district_names) > 0
+                or len(self.settlement_names) > 0)
 
 
 class RegionFinder(ABC):
@@ -11,6 +91,12 @@ class RegionFinder(ABC):
     ----------
     address : str
         адресная строка
+    max_address_length : Optional[int]
+        максимальная длина подготовленной адресной строки, None - без
+        ограничения; более длинная строка обрезается (_prepare_address)
+
+    Результаты методов поиска вычисляются один раз для экземпляра
+    и переиспользуются в is_address и в методах наследников.
 
     Методы
     -------
@@ -30,20 +116,32 @@ class RegionFinder(ABC):
         Ищет упоминания посёлков и сёл РФ и возвращает их список.
     is_address():
         Возвращает True, если в строке есть адрес.
+    _scan_features():
+        Возвращает множество категорий признаков адреса, найденных
+        за один проход по строке.
+    find_many():
+        Ищет признаки регионов в каждой строке из набора адресов.
+    warm_up():
+        Заранее компилирует регулярные выражения.
     define_regions():
         абстрактный метод, реализующий логику работу по поиску
         совпадений в справочниках.
     """
 
     # https://regex101.com/r/uTsCxy/1
-    _postcode_regex = re.compile(
+    _postcode_regex = _LazyPattern(
         r'(?:^|\s|[А-Яа-яA-Za-z][.,;]|;)(\d{6})(?![:\d])')
-    _postcode_first_3_regex = re.compile(
+    _postcode_first_3_regex = _LazyPattern(
         r'(?:^|\s|[А-Яа-яA-Za-z][.,;]|;)(\d{3})\d{3}(?![:\d])')
 
     # https://regex101.com/r/jO3iI9/1
-    _region_name_regex = re.compile(
-        r'\b(?:северная осетия|марий эл|[а-яё]{2,}(?:-|—|)[а-яё]{2,})'
+    # Конструкция (?=(?P<x>...))(?P=x) захватывает последовательность букв
+    # целиком без возврата (атомарная группа), поэтому время поиска
+    # линейно зависит от длины строки даже для длинных слов.
+    _region_name_regex = _LazyPattern(
+        r'\b(?:северная осетия|марий эл'
+        r'|(?=(?P<rn1>[а-яё]{2,}))(?P=rn1)'
+        r'(?:[-—](?=(?P<rn2>[а-яё]{2,}))(?P=rn2)|(?<=[а-яё]{4})))'
         r'(?= (?:автономн[аы][яй] о(?:бласть|круг|бл)'
         r'|область|обл\.?'
         r'|(?:народная )*республик[иа]'
@@ -51,19 +149,41 @@ class RegionFinder(ABC):
         r'|край'
         r'|кр\.?'
         r')\b)'
-        r'|\b(?:москва|севастополь|санкт-петербург)\b'
+        # Названия-прилагательные в косвенных падежах перед статусом
+        # в том же падеже (томской области, приморскому краю)
+        r'|\b(?P<rd>северн(?:ой|ую) осети(?:и|ю|ей)'
+        r'|(?=(?P<rd1>[а-яё]{3,}))(?P=rd1)'
+        r'(?:[-—](?=(?P<rd2>[а-яё]{2,}))(?P=rd2))?'
+        r'(?:(?<=ой)|(?<=ую)|(?<=ого)|(?<=ому)|(?<=ым)|(?<=им)|(?<=ом)))'
+        r'(?= (?:автономн(?:ой|ую|ого|ому|ым|ом) о(?:бласт(?:и|ью)'
+        r'|круг(?:а|у|ом|е)?|бл)'
+        r'|област(?:и|ью)'
+        r'|(?:народн(?:ой|ую) )*республик(?:е|у|ой)'
+        r'|кра(?:я|ю|ем|е)'
+        r')\b)'
+        r'|\b(?:москв(?:а|ы|е|у|ой)'
+        r'|севастопол(?:ь|я|ю|ем|е)'
+        r'|санкт-петербург(?:а|у|ом|е)?)\b'
         r'|(?:(?<=область )'
         r'|(?<=обл\. )'
         r'|(?<=\bобл )'
-        r'|(?<=республик[аи] )'
+        r'|(?<=республик[аиеу] )'
+        r'|(?<=республикой )'
         r'|(?<=\bресп\. )'
         r'|(?<=\bресп )'
         r'|(?<=край )'
         r'|(?<=\bкр\. ))'
-        r'(?:северная осетия|марий эл|\b[а-яё]{2,}(?:-|—|)[а-яё]{2,})')
+        r'(?:северн(?:ая|ой|ую) осети(?:я|и|ю|ей)|марий эл'
+        r'|\b[а-яё]{2,}(?:-|—|)[а-яё]{2,})')
+
+    # Окончания прилагательных в косвенных падежах и соответствующие
+    # окончания именительного падежа для названий не из справочника
+    _region_adjective_endings = (('ой', 'ая'), ('ую', 'ая'), ('ого', 'ий'),
+                                 ('ому', 'ий'), ('ым', 'ий'), ('им', 'ий'),
+                                 ('ом', 'ий'))
 
     # https://regex101.com/r/FO68Xo/1
-    _city_name_regex = re.compile(
+    _city_name_regex = _LazyPattern(
         r'\b(?:г\.?|город) ?'
         r'('
         r'(?:'
@@ -97,12 +217,14 @@ class RegionFinder(ABC):
         r' )*'
         r'\b[а-яё]+-?[а-яё]+-?[а-яё]+)'
     )
-    _district_regex = re.compile(
-        r'\b\w+-?\w+\b(?= \bрайон\b| \bр-о?н\b)'
+    _district_regex = _LazyPattern(
+        r'\b(?=(?P<dn1>\w+))(?P=dn1)'
+        r'(?:-(?=(?P<dn2>\w+))(?P=dn2)|(?<=\w\w))'
+        r'\b(?= \bрайон\b| \bр-о?н\b)'
     )
 
     # https://regex101.com/r/wjUGj9/1
-    _settlement_regex = re.compile(
+    _settlement_regex = _LazyPattern(
         r'(?:(?<=\bр\.п\. )'
         r'|(?<=\bн\.п\. )'
         r'|(?<=\bп\. )'
@@ -115,7 +237,7 @@ class RegionFinder(ABC):
     )
 
     # https://regex101.com/r/IjDK3y/1
-    _street_regex = re.compile(
+    _street_regex = _LazyPattern(
         r'\b(?:'
         r'аллея'
         r'|линия'
@@ -134,75 +256,394 @@ class RegionFinder(ABC):
         r'\b'
     )
 
-    _region_name_sub_regex = re.compile(r'\b(\w+)ой\b (\bобласт)[ьи]\b')
-    _edge_name_sub_regex = re.compile(r'\b(\w+)(?:ого|ий)\b (\bкра)[йя]\b')
-
-    def __init__(self, address: str) -> None:
-        """Конструктор класса."""
+    # Категории признаков адреса (_scan_features, SpanScanner)
+    _feature_categories = ('street', 'region', 'postcode',
+                           'city', 'district', 'settlement')
+
+    # Подстроки, без которых регулярные выражения категории не могут
+    # совпасть (для почтовых индексов - цифра, см. _may_match)
+    _feature_anchors = {
+        'region': ('обл', 'респ', 'кр', 'автономн',
+                   'москв', 'севастопол', 'санкт-петербург'),
+        'city': ('г',),
+        'district': (' район', ' р-н', ' р-он'),
+        'settlement': ('п. ', 'с. ', 'пгт', 'село ', 'поселок '),
+    }
+
+    # Регулярные выражения, для которых составлены _feature_anchors.
+    # Если наследник переопределяет любое из них, проверка подстрок
+    # для категории отключается.
+    _feature_patterns = {
+        'region': ('_region_name_regex',),
+        'postcode': ('_postcode_regex', '_postcode_first_3_regex'),
+        'city': ('_city_name_regex',),
+        'district': ('_district_regex',),
+        'settlement': ('_settlement_regex',),
+    }
+
+    # Ограничение длины строки для защиты от мусорных входных данных
+    max_address_length: Optional[int] = None
+
+    __slots__ = ('_address', '_memo')
+
+    def __init__(self, address: str,
+                 cache: Optional[ExtractionCache] = None) -> None:
+        """Конструктор класса.
+
+        Если передан кеш, результаты поиска для адресной строки
+        берутся из него или вычисляются и сохраняются в него."""
 
         if not address:
             raise ValueError('Адрес не должен быть пустым')
 
-        self.address = self._beatify_address(address)
+        self.address = self._prepare_address(address)
+        if cache is not None:
+            result = self._cached_extract(self.address, cache)
+            self._memo.update(
+                _are_street_attrs_in_address=result.has_street,
+                _find_postcodes=result.postcodes,
+                _find_first_3_postcodes=result.first_3_postcodes,
+                _find_region_names=result.region_names,
+                _find_city_names=result.city_names,
+                _find_district_names=result.district_names,
+                _find_settlement_names=result.settlement_names,
+            )
+
+    @property
+    def address(self) -> str:
+        """Подготовленная адресная строка."""
+
+        return self._address
+
+    @address.setter
+    def address(self, value: str) -> None:
+        self._address = value
+        self._memo = {}
+
+    @staticmethod
+    def _beatify_address(address: str) -> str:
+        """Удаляет лишние символы из адресной строки
+        (см. normalize_address)."""
+
+        return normalize_address(address)
+
+    @classmethod
+    def _prepare_address(cls, address: str) -> str:
+        """Подготавливает адресную строку и обрезает её
+        до max_address_length символов.
+
+        Если граница обрезки приходится на середину слова, обрезанное
+        слово отбрасывается целиком, чтобы его часть не совпала
+        с регулярными выражениями. Если в допустимой части строки
+        нет пробелов, строка обрезается ровно по границе."""
+
+        address = cls._beatify_address(address)
+        limit = cls.max_address_length
+        if limit is None or len(address) <= limit:
+            return address
+        if address[limit] == ' ':
+            return address[:limit]
+        space = address.rfind(' ', 0, limit)
+        return address[:space] if space > 0 else address[:limit]
+
+    @classmethod
+    def _may_match(cls, category: str, address: str) -> bool:
+        """Возвращает False, если в строке нет подстрок, без которых
+        регулярные выражения категории не могут совпасть.
+
+        Проверка выполняется, только если регулярные выражения категории
+        совпадают с теми, для которых составлены _feature_anchors."""
+
+        if not _is_gated(cls, category):
+            return True
+        if category == 'postcode':
+            # \d совпадает и с цифрами других алфавитов, поэтому вместо
+            # проверки подстрок - поиск одной цифры, он так же дёшев
+            return _digit_regex.search(address) is not None
+        return any(anchor in address
+                   for anchor in cls._feature_anchors[category])
+
+    @classmethod
+    def _has_street_in(cls, address: str) -> bool:
+        """Вычисляет есть ли элементы улично-дорожной сети
+        в подготовленной адресной строке."""
+
+        return cls._street_regex.search(address) is not None
+
+    @classmethod
+    def _postcodes_in(cls, address: str) -> List[str]:
+        """Возвращает список почтовых индексов
+        в подготовленной адресной строке."""
+
+        if not cls._may_match('postcode', address):
+            return []
+        return cls._postcode_regex.findall(address)
+
+    @classmethod
+    def _first_3_postcodes_in(cls, address: str) -> List[str]:
+        """Возвращает список первых трех символов почтовых индексов
+        в подготовленной адресной строке."""
+
+        if not cls._may_match('postcode', address):
+            return []
+        return cls._postcode_first_3_regex.findall(address)
+
+    @classmethod
+    def _region_names_in(cls, address: str) -> List[str]:
+        """Возвращает список названий регионов
+        в подготовленной адресной строке."""
+
+        if not cls._may_match('region', address):
+            return []
+        inflections = region_inflections()
+        names = []
+        for match in cls._region_name_regex.finditer(address):
+            if 'rd' not in match.re.groupindex:
+                # Выражение наследника без именованных групп: значение
+                # берётся как в findall
+                names.append(match.group(1) if match.re.groups == 1
+                             else match.group())
+                continue
+            name = match.group()
+            if name in inflections:
+                name = inflections[name]
+            elif match.group('rd'):
+                name = cls._region_nominative(name)
+            names.append(name)
+        return names
+
+    @classmethod
+    def _region_nominative(cls, name: str) -> str:
+        """Возвращает именительный падеж названия-прилагательного,
+        которого нет в таблице падежных форм."""
+
+        for ending, nominative in cls._region_adjective_endings:
+            if name.endswith(ending):
+                return name[:-len(ending)] + nominative
+        return name
+
+    @classmethod
+    def _city_names_in(cls, address: str) -> List[str]:
+        """Возвращает список названий городов
+        в подготовленной адресной строке."""
+
+        if not cls._may_match('city', address):
+            return []
+        return cls._city_name_regex.findall(address)
+
+    @classmethod
+    def _district_names_in(cls, address: str) -> List[str]:
+        """Возвращает список названий районов
+        в подготовленной адресной строке."""
+
+        if not cls._may_match('district', address):
+            return []
+        return [match.group()
+                for match in cls._district_regex.finditer(address)]
 
-    def _beatify_address(self, address: str) -> str:
-        """Удаляет лишние символы из адресной строки."""
+    @classmethod
+    def _settlement_names_in(cls, address: str) -> List[str]:
+        """Возвращает список названий поселков
+        в подготовленной адресной строке."""
 
-        address = re.sub(r' {2,}', ' ', address.lower())
-        address = re.sub('ё', 'е', address)
-        return re.sub(u'\xa0', ' ', address)
+        if not cls._may_match('settlement', address):
+            return []
+        return cls._settlement_regex.findall(address)
 
+    @_memoized
     def _are_street_attrs_in_address(self) -> bool:
         """Вычисляет есть ли элементы улично-дорожной сети в строке."""
 
-        return self._street_regex.search(self.address) is not None
+        return self._has_street_in(self.address)
 
+    @_memoized
     def _find_postcodes(self) -> List[str]:
         """Возвращает список почтовых индексов
          - последовательности из 6 цифр."""
 
-        return self._postcode_regex.findall(self.address)
+        return self._postcodes_in(self.address)
 
+    @_memoized
     def _find_first_3_postcodes(self) -> List[str]:
         """Возвращает список захваченных первых трех символов почтовых индексов
          - последовательности из 6 цифр."""
 
-        return self._postcode_first_3_regex.findall(self.address)
+        return self._first_3_postcodes_in(self.address)
 
+    @_memoized
     def _find_region_names(self) -> List[str]:
         """Возвращает список названий регионов."""
 
-        address = self._region_name_sub_regex.sub(r'\1ая \2ь', self.address)
-        address = self._edge_name_sub_regex.sub(r'\1ий \2й', address)
-        return self._region_name_regex.findall(address)
+        return self._region_names_in(self.address)
 
+    @_memoized
     def _find_city_names(self) -> List[str]:
         """Возвращает список названий городов
         по характерным признакам перед их названиями
         (буква г с точкой или без)."""
 
-        return self._city_name_regex.findall(self.address)
+        return self._city_names_in(self.address)
 
+    @_memoized
     def _find_district_names(self) -> List[str]:
         """Возвращает список названий районов."""
 
-        return self._district_regex.findall(self.address)
+        return self._district_names_in(self.address)
 
+    @_memoized
     def _find_settlement_names(self) -> List[str]:
         """Возвращает список названий поселков
          городского типа, поселков и сел."""
 
-        return self._settlement_regex.findall(self.address)
+        return self._settlement_names_in(self.address)
 
     def is_address(self) -> bool:
-        """Возвращает True, если в строке есть адрес, иначе False."""
-
-        return (self._are_street_attrs_in_address() or
-                len(self._find_region_names()) > 0 or
-                len(self._find_first_3_postcodes()) > 0 or
-                len(self._find_city_names()) > 0 or
-                len(self._find_district_names()) > 0 or
-                len(self._find_settlement_names()) > 0)
+        """Возвращает True, если в строке есть адрес, иначе False.
+
+        Категории признаков проверяются по порядку до первого найденного;
+        результаты методов поиска запоминаются и переиспользуются
+        в define_regions. Регулярные выражения категорий, подстрок
+        которых нет в строке, не запускаются (см. _may_match)."""
+
+        return (self._are_street_attrs_in_address()
+                or len(self._find_region_names()) > 0
+                or len(self._find_first_3_postcodes()) > 0
+                or len(self._find_city_names()) > 0
+                or len(self._find_district_names()) > 0
+                or len(self._find_settlement_names()) > 0)
+
+    @classmethod
+    def _feature_sources(cls) -> Dict[str, str]:
+        """Возвращает исходные тексты регулярных выражений
+        по категориям признаков адреса."""
+
+        return {
+            'street': cls._street_regex.pattern,
+            'region': cls._region_name_regex.pattern,
+            'postcode': cls._postcode_first_3_regex.pattern,
+            'city': cls._city_name_regex.pattern,
+            'district': cls._district_regex.pattern,
+            'settlement': cls._settlement_regex.pattern,
+        }
+
+    def _scan_features(self, categories: Optional[Iterable[str]] = None,
+                       first_hit: bool = False) -> Set[str]:
+        """Возвращает множество категорий признаков адреса
+        (по умолчанию - всех _feature_categories), найденных в строке.
+
+        Все категории ищутся одним объединённым регулярным выражением.
+        Найденная категория исключается из дальнейшего поиска, а поиск
+        продолжается с позиции последнего совпадения, поэтому строка
+        просматривается один раз. При first_hit=True поиск завершается
+        на первом найденном признаке.
+
+        В отличие от is_address, результаты не запоминаются и методы
+        _find_* наследников не вызываются: учитываются только
+        регулярные выражения."""
+
+        sources = self._feature_sources()
+        remaining = tuple(
+            category for category in (self._feature_categories
+                                      if categories is None else categories)
+            if self._may_match(category, self.address))
+        found = set()
+        pos = 0
+        while remaining:
+            scanner = _compile_feature_scanner(tuple(
+                (category, sources[category]) for category in remaining))
+            match = scanner.search(self.address, pos)
+            if match is None:
+                break
+            found.add(match.lastgroup)
+            if first_hit:
+                break
+            pos = match.start()
+            remaining = tuple(category for category in remaining
+                              if category != match.lastgroup)
+        return found
+
+    @classmethod
+    def _extract(cls, address: str) -> AddressResult:
+        """Ищет все признаки регионов в подготовленной адресной строке."""
+
+        return AddressResult(
+            address=address,
+            postcodes=cls._postcodes_in(address),
+            first_3_postcodes=cls._first_3_postcodes_in(address),
+            region_names=cls._region_names_in(address),
+            city_names=cls._city_names_in(address),
+            district_names=cls._district_names_in(address),
+            settlement_names=cls._settlement_names_in(address),
+            has_street=cls._has_street_in(address),
+        )
+
+    @classmethod
+    def warm_up(cls) -> None:
+        """Заранее компилирует регулярные выражения и загружает таблицу
+        падежных форм, которые иначе готовятся при первом поиске.
+        Полезно для долгоживущих процессов (серверов)."""
+
+        cls.patterns_version()
+        region_inflections()
+
+    @classmethod
+    def patterns_version(cls) -> str:
+        """Возвращает хеш всего, от чего зависят результаты поиска:
+        версии пакета, класса, его регулярных выражений и таблиц
+        названий регионов.
+
+        Хеш меняется при обновлении пакета, у каждого наследника свой
+        (методы поиска могут быть переопределены), а также меняется
+        при изменении любого регулярного выражения, окончаний
+        _region_adjective_endings и таблицы падежных форм
+        (файла регионов и правил склонения)."""
+
+        return _patterns_version(
+            '{}:{}.{}'.format(_package_version, cls.__module__,
+                              cls.__qualname__),
+            tuple((name, _unwrap(getattr(cls, name)))
+                  for name in _pattern_names(cls)),
+            tuple(cls._region_adjective_endings),
+            inflections_version())
+
+    @classmethod
+    def _cached_extract(cls, address: str,
+                        cache: ExtractionCache) -> AddressResult:
+        """Возвращает результат поиска из кеша или вычисляет его
+        и сохраняет в кеш. Списки результата копируются, чтобы их
+        изменение не портило кеш.
+
+        Ключ кеша включает версию patterns_version, поэтому один кеш
+        можно использовать с разными наследниками: их записи
+        не пересекаются."""
+
+        key = (cls.patterns_version(), address)
+        result = cache.get(key)
+        if result is None:
+            result = cls._extract(address)
+            cache.put(key, result)
+        return _copy_result(result)
+
+    @classmethod
+    def find_many(cls, addresses: Iterable[str],
+                  cache: Optional[ExtractionCache] = None
+                  ) -> Iterator[AddressResult]:
+        """Ищет признаки регионов в каждой адресной строке набора
+        без создания экземпляра класса на каждую строку.
+
+        Пустая строка не прерывает обработку: для неё возвращается
+        результат с заполненным полем error. Если передан кеш,
+        повторяющиеся адреса обрабатываются один раз."""
+
+        for address in addresses:
+            if not address:
+                yield _empty_result(address, 'Адрес не должен быть пустым')
+                continue
+            address = cls._prepare_address(address)
+            if cache is None:
+                yield cls._extract(address)
+            else:
+                yield cls._cached_extract(address, cache)
 
     @abstractmethod
     def define_regions(self, **kwargs):
@@ -212,3 +653,105 @@ class RegionFinder(ABC):
         в БД, или в хеш-таблицах, или в файлах."""
 
         pass
+
+
+def _empty_result(address: str, error: str) -> AddressResult:
+    """Возвращает результат без найденных признаков с текстом ошибки."""
+
+    return AddressResult(address=address, postcodes=[], first_3_postcodes=[],
+                         region_names=[], city_names=[], district_names=[],
+                         settlement_names=[], has_street=False, error=error)
+
+
+def _copy_result(result: AddressResult) -> AddressResult:
+    """Возвращает копию результата с новыми списками."""
+
+    return result._replace(
+        postcodes=list(result.postcodes),
+        first_3_postcodes=list(result.first_3_postcodes),
+        region_names=list(result.region_names),
+        city_names=list(result.city_names),
+        district_names=list(result.district_names),
+        settlement_names=list(result.settlement_names),
+    )
+
+
+def _is_gated(finder_cls, category: str) -> bool:
+    """Возвращает True, если для категории можно проверять подстроки:
+    её текущие регулярные выражения - те, для которых составлены
+    _feature_anchors.
+
+    Текущие выражения берутся при каждом вызове, поэтому выражения,
+    заменённые во время работы, сразу отключают проверку подстрок."""
+
+    names = finder_cls._feature_patterns.get(category)
+    if not names:
+        return False
+    anchored = _anchored_patterns(finder_cls)
+    for name in names:
+        pattern = getattr(finder_cls, name)
+        if (pattern is not anchored.get(name)
+                and _unwrap(pattern) is not anchored.get(name)):
+            return False
+    return True
+
+
+@lru_cache(maxsize=None)
+def _anchored_patterns(finder_cls) -> Dict[str, object]:
+    """Возвращает регулярные выражения класса, в котором объявлены
+    _feature_anchors, по именам атрибутов."""
+
+    owner = next(klass for klass in finder_cls.__mro__
+                 if '_feature_anchors' in vars(klass))
+    return {name: _unwrap(getattr(owner, name))
+            for names in owner._feature_patterns.values()
+            for name in names}
+
+
+@lru_cache(maxsize=None)
+def _pattern_names(finder_cls) -> Tuple[str, ...]:
+    """Возвращает имена атрибутов класса
+    с откомпилированными регулярными выражениями."""
+
+    return tuple(name for name in dir(finder_cls)
+                 if isinstance(_unwrap(getattr(finder_cls, name)), _Pattern))
+
+
+def _unwrap(value):
+    """Возвращает исходный объект, если value - обёртка
+    (например, регулярное выражение с замером времени
+    из модуля instrumentation)."""
+
+    return getattr(value, '__wrapped__', value)
+
+
+@lru_cache(maxsize=64)
+def _patterns_version(owner: str, patterns, adjective_endings,
+                      inflections: str) -> str:
+    """Вычисляет хеш по версии пакета и имени класса, именам, флагам
+    и текстам регулярных выражений, окончаниям прилагательных и хешу
+    таблицы падежных форм."""
+
+    # hashlib заметно замедляет импорт пакета, а нужен только для кеша
+    import hashlib
+
+    digest = hashlib.sha1('{}\n'.format(owner).encode('utf-8'))
+    for name, pattern in patterns:
+        digest.update('{}:{}:{}\n'.format(
+            name, pattern.flags, pattern.pattern).encode('utf-8'))
+    digest.update('{!r}\n{}\n'.format(
+        adjective_endings, inflections).encode('utf-8'))
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=64)
+def _compile_feature_scanner(sources: Tuple[Tuple[str, str], ...]):
+    """Компилирует объединённое регулярное выражение, в котором
+    каждая категория признаков адреса - именованная группа.
+
+    Ключ кеша - тексты выражений, поэтому выражения, заменённые
+    во время работы, дают новое объединённое выражение."""
+
+    return re.compile('|'.join(
+        '(?P<{}>{})'.format(category, source)
+        for category, source in sources))
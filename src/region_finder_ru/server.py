@@ -0,0 +1,340 @@
+"""HTTP-сервис поиска признаков регионов на стандартной библиотеке.
+
+Пример запуска:
+
+    python -m region_finder_ru.server --port 8000 --workers 4
+
+Запросы:
+
+    POST /find     {"address": "..."} или {"addresses": ["...", ...]}
+    GET  /healthz  проверка работоспособности
+    GET  /metrics  счётчики и перцентили задержки в JSON
+
+Одновременные запросы в течение max_delay секунд объединяются в одну
+часть, которая обрабатывается RegionFinder.find_many в пуле процессов.
+"""
+
+import argparse
+import json
+import queue
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from typing import List, Optional, Sequence, Tuple
+
+from .cli import _process_chunk, _result_to_dict
+from .region_finder_ru import AddressResult, RegionFinder
+
+# Перцентили задержки, которые возвращает /metrics
+PERCENTILES = (50, 90, 99)
+
+
+class _Metrics:
+    """Счётчики запросов и задержки последних запросов."""
+
+    def __init__(self, window: int = 10_000) -> None:
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=window)
+        self.requests = 0
+        self.addresses = 0
+        self.batches = 0
+        self.errors = 0
+
+    def record_request(self, latency: float, addresses: int) -> None:
+        with self._lock:
+            self.requests += 1
+            self.addresses += addresses
+            self._latencies.append(latency)
+
+    def record_batch(self) -> None:
+        with self._lock:
+            self.batches += 1
+
+    def record_error(self) -> None:
+        with self._lock:
+            self.errors += 1
+
+    def snapshot(self) -> dict:
+        """Возвращает счётчики и перцентили задержки в миллисекундах."""
+
+        with self._lock:
+            latencies = sorted(self._latencies)
+            snapshot = {'requests': self.requests,
+                        'addresses': self.addresses,
+                        'batches': self.batches,
+                        'errors': self.errors}
+        for percentile in PERCENTILES:
+            value = None
+            if latencies:
+                index = min(len(latencies) - 1,
+                            len(latencies) * percentile // 100)
+                value = round(latencies[index] * 1000, 3)
+            snapshot['latency_p{}_ms'.format(percentile)] = value
+        return snapshot
+
+
+class _Batcher:
+    """Объединяет адреса одновременных запросов в части
+    и передаёт их в пул процессов."""
+
+    def __init__(self, workers: int, max_delay: float, max_batch: int,
+                 metrics: _Metrics) -> None:
+        self.max_delay = max_delay
+        self.max_batch = max_batch
+        self._metrics = metrics
+        self._queue = queue.Queue()
+        self._executor = (ProcessPoolExecutor(max_workers=workers)
+                          if workers > 1 else None)
+        # Не более двух частей в обработке на процесс
+        self._slots = threading.BoundedSemaphore(max(workers, 1) * 2)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, addresses: List[str]) -> 'Future[List[AddressResult]]':
+        """Ставит адреса в очередь и возвращает Future с результатами."""
+
+        future = Future()
+        self._queue.put((addresses, future))
+        return future
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+        if self._executor is not None:
+            self._executor.shutdown()
+
+    def _run(self) -> None:
+        stopped = False
+        while not stopped:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            size = len(item[0])
+            deadline = time.monotonic() + self.max_delay
+            while size < self.max_batch:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopped = True
+                    break
+                batch.append(item)
+                size += len(item[0])
+            self._dispatch(batch)
+
+    def _dispatch(self, batch: List[Tuple[List[str], Future]]) -> None:
+        """Передаёт часть на обработку."""
+
+        addresses = [address for request, _ in batch for address in request]
+        self._metrics.record_batch()
+        if self._executor is None:
+            try:
+                results = _process_chunk(addresses)
+            except Exception as error:
+                self._deliver(batch, error=error)
+            else:
+                self._deliver(batch, results)
+            return
+
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(_process_chunk, addresses)
+        except Exception as error:
+            # Например, BrokenProcessPool: поток очереди продолжает работу
+            self._slots.release()
+            self._deliver(batch, error=error)
+            return
+        future.add_done_callback(partial(self._on_done, batch))
+
+    def _on_done(self, batch: List[Tuple[List[str], Future]],
+                 future: Future) -> None:
+        self._slots.release()
+        error = future.exception()
+        if error is not None:
+            self._deliver(batch, error=error)
+        else:
+            self._deliver(batch, future.result())
+
+    @staticmethod
+    def _deliver(batch: List[Tuple[List[str], Future]],
+                 results: Optional[List[AddressResult]] = None,
+                 error: Optional[BaseException] = None) -> None:
+        """Раздаёт результаты части запросам, из которых она составлена."""
+
+        position = 0
+        for request, future in batch:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(results[position:position + len(request)])
+                position += len(request)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Обработчик HTTP-запросов сервиса."""
+
+    server: 'RegionFinderServer'
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self) -> None:
+        if self.path == '/healthz':
+            self._send(200, {'status': 'ok'})
+        elif self.path == '/metrics':
+            self._send(200, self.server.metrics.snapshot())
+        else:
+            self._send(404, {'error': 'Не найдено'})
+
+    def do_POST(self) -> None:
+        if self.path != '/find':
+            self._send(404, {'error': 'Не найдено'})
+            return
+
+        started = time.perf_counter()
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            if length < 0:
+                raise ValueError('Некорректная длина запроса')
+            if length > self.server.max_body_size:
+                raise ValueError('Слишком большой запрос')
+            payload = json.loads(self.rfile.read(length).decode('utf-8'))
+            single = 'address' in payload
+            addresses = ([payload['address']] if single
+                         else payload['addresses'])
+            if (not isinstance(addresses, list)
+                    or not all(isinstance(address, str)
+                               for address in addresses)):
+                raise ValueError('Адреса должны быть строками')
+        except (ValueError, KeyError, TypeError, AttributeError) as error:
+            self.server.metrics.record_error()
+            self._send(400, {'error': str(error) or 'Некорректный запрос'})
+            return
+
+        try:
+            results = self.server.batcher.submit(addresses).result()
+        except Exception as error:
+            self.server.metrics.record_error()
+            self._send(500, {'error': str(error)})
+            return
+
+        results = [_result_to_dict(result) for result in results]
+        # Запрос учитывается до ответа, чтобы клиент сразу видел его
+        # в /metrics
+        self.server.metrics.record_request(time.perf_counter() - started,
+                                           len(addresses))
+        self._send(200, results[0] if single else {'results': results})
+
+    def _send(self, status: int, body: dict) -> None:
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args) -> None:
+        """Журнал запросов не ведётся."""
+
+
+class RegionFinderServer(ThreadingMixIn, HTTPServer):
+    """Класс RegionFinderServer - многопоточный HTTP-сервер,
+    объединяющий одновременные запросы в части.
+
+    Атрибуты
+    ----------
+    metrics : _Metrics
+        счётчики запросов и задержки
+    batcher : _Batcher
+        очередь адресов, обрабатываемых частями
+    max_body_size : int
+        максимальный размер тела запроса в байтах
+
+    Методы
+    -------
+    start():
+        Запускает сервер в фоновом потоке.
+    close():
+        Останавливает сервер и пул процессов.
+    """
+
+    daemon_threads = True
+    # Очередь соединений, ожидающих accept, при всплеске запросов
+    request_queue_size = 128
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 8000,
+                 workers: int = 1, max_delay: float = 0.005,
+                 max_batch: int = 1000,
+                 max_body_size: int = 10 * 1024 * 1024) -> None:
+        """Конструктор класса. При workers == 1 части обрабатываются
+        без пула процессов; port 0 - любой свободный порт."""
+
+        if workers < 1:
+            raise ValueError('Количество процессов должно быть '
+                             'положительным')
+        super().__init__((host, port), _Handler)
+        self.max_body_size = max_body_size
+        self.metrics = _Metrics()
+        self.batcher = _Batcher(workers, max_delay, max_batch, self.metrics)
+        self._thread = None
+
+    def start(self) -> None:
+        """Запускает обработку запросов в фоновом потоке."""
+
+        self._thread = threading.Thread(target=self.serve_forever,
+                                        daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """Останавливает сервер и пул процессов."""
+
+        if self._thread is not None:
+            self.shutdown()
+            self._thread.join()
+        self.server_close()
+        self.batcher.close()
+
+    def __enter__(self) -> 'RegionFinderServer':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Запускает сервер из командной строки."""
+
+    parser = argparse.ArgumentParser(
+        prog='python -m region_finder_ru.server',
+        description='HTTP-сервис поиска признаков регионов РФ.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('-w', '--workers', type=int, default=1,
+                        help='количество процессов')
+    parser.add_argument('--max-delay', type=float, default=0.005,
+                        help='время накопления части в секундах')
+    parser.add_argument('--max-batch', type=int, default=1000,
+                        help='максимальное количество адресов в части')
+    args = parser.parse_args(argv)
+
+    # Регулярные выражения компилируются до первого запроса
+    RegionFinder.warm_up()
+    with RegionFinderServer(args.host, args.port, args.workers,
+                            args.max_delay, args.max_batch) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
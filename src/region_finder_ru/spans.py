@@ -0,0 +1,222 @@
+"""Поиск признаков адреса в больших текстах с возвратом позиций."""
+
+import re
+from bisect import bisect_right
+from typing import (Iterable, Iterator, List, NamedTuple, Optional, Sequence,
+                    Type)
+
+from .normalization import _QUOTES, _TABLE
+from .region_finder_ru import RegionFinder
+
+# Регулярное выражение и номер группы, позиции которой возвращаются,
+# по категориям признаков адреса
+_SPAN_PATTERNS = {
+    'street': ('_street_regex', 0),
+    'region': ('_region_name_regex', 0),
+    'postcode': ('_postcode_regex', 1),
+    'city': ('_city_name_regex', 1),
+    'district': ('_district_regex', 0),
+    'settlement': ('_settlement_regex', 1),
+}
+
+# Слова текста: кавычки при подготовке заменяются пробелом,
+# поэтому тоже разделяют слова
+_token_regex = re.compile(r'[^\s{}]+'.format(re.escape(_QUOTES)))
+
+
+class Span(NamedTuple):
+    """Признак адреса, найденный в тексте: категория и позиции
+    начала и конца в исходном (не подготовленном) тексте."""
+
+    category: str
+    start: int
+    end: int
+
+
+class SpanScanner:
+    """Класс SpanScanner ищет признаки адреса в тексте, поступающем
+    порциями, и возвращает их позиции в исходном тексте.
+
+    Каждая порция подготавливается так же, как normalize_address,
+    с сохранением соответствия позиций подготовленного и исходного
+    текста. В памяти хранится только хвост подготовленного текста
+    длиной не более 2 * overlap символов и незавершённое слово,
+    поэтому признак на границе порций находится целиком, если его
+    длина не превышает overlap.
+
+    Атрибуты
+    ----------
+    patterns : List[Tuple[str, Pattern, int]]
+        категория, регулярное выражение и номер группы
+    overlap : int
+        количество символов подготовленного текста, которые
+        переносятся в следующую порцию
+
+    Методы
+    -------
+    feed():
+        Добавляет порцию текста и возвращает найденные в ней признаки.
+    close():
+        Завершает текст и возвращает оставшиеся признаки.
+    """
+
+    __slots__ = ('patterns', 'overlap', '_raw', '_raw_start', '_text',
+                 '_base', '_norm_starts', '_orig_starts', '_reported')
+
+    def __init__(self, finder: Type[RegionFinder] = RegionFinder,
+                 categories: Optional[Sequence[str]] = None,
+                 overlap: int = 1024) -> None:
+        """Конструктор класса. Регулярные выражения берутся из класса
+        finder, по умолчанию ищутся все категории признаков."""
+
+        if overlap <= 0:
+            raise ValueError('Перекрытие порций должно быть положительным')
+        if categories is None:
+            categories = finder._feature_categories
+
+        self.patterns = []
+        for category in categories:
+            if category not in _SPAN_PATTERNS:
+                raise ValueError(
+                    'Неизвестная категория признаков: {}'.format(category))
+            name, group = _SPAN_PATTERNS[category]
+            self.patterns.append((category, getattr(finder, name), group))
+        self.overlap = overlap
+
+        # Незавершённое слово в конце последней порции и его позиция
+        self._raw = ''
+        self._raw_start = 0
+        # Хвост подготовленного текста и его позиция в подготовленном
+        # тексте целиком
+        self._text = ''
+        self._base = 0
+        # Начала участков, в которых позиции подготовленного и исходного
+        # текста отличаются на постоянную величину
+        self._norm_starts: List[int] = []
+        self._orig_starts: List[int] = []
+        # Признаки, заканчивающиеся не дальше этой позиции, уже возвращены
+        self._reported = 0
+
+    def feed(self, chunk: str) -> List[Span]:
+        """Добавляет порцию текста и возвращает признаки, которые
+        уже не могут измениться при поступлении следующих порций."""
+
+        text = self._raw + chunk
+        start = self._raw_start
+
+        # Слово, не завершённое пробельным символом, переносится
+        # в следующую порцию (кроме слишком длинных)
+        cut = len(text)
+        while cut and not text[cut - 1].isspace():
+            cut -= 1
+        if cut == 0 and len(text) > self.overlap:
+            cut = len(text)
+
+        self._append(text[:cut], start)
+        self._raw = text[cut:]
+        self._raw_start = start + cut
+        return self._scan(final=False)
+
+    def close(self) -> List[Span]:
+        """Завершает текст и возвращает оставшиеся признаки."""
+
+        self._append(self._raw, self._raw_start)
+        self._raw = ''
+        return self._scan(final=True)
+
+    def _append(self, text: str, offset: int) -> None:
+        """Подготавливает текст и добавляет его в хвост."""
+
+        length = self._base + len(self._text)
+        parts = [self._text]
+        for match in _token_regex.finditer(text):
+            token = match.group()
+            position = offset + match.start()
+            normalized = token.lower().translate(_TABLE)
+            if not normalized:
+                continue
+            if length:
+                self._norm_starts.append(length)
+                self._orig_starts.append(position - 1)
+                parts.append(' ')
+                length += 1
+            if len(normalized) == len(token):
+                self._norm_starts.append(length)
+                self._orig_starts.append(position)
+                parts.append(normalized)
+                length += len(normalized)
+                continue
+            # Длина слова изменилась: соответствие позиций по символам
+            for index, char in enumerate(token):
+                char = char.lower().translate(_TABLE)
+                if char:
+                    self._norm_starts.append(length)
+                    self._orig_starts.append(position + index)
+                    parts.append(char)
+                    length += len(char)
+        self._text = ''.join(parts)
+
+    def _original(self, position: int) -> int:
+        """Возвращает позицию в исходном тексте по позиции
+        в подготовленном тексте."""
+
+        index = bisect_right(self._norm_starts, position) - 1
+        return self._orig_starts[index] + position - self._norm_starts[index]
+
+    def _scan(self, final: bool) -> List[Span]:
+        """Ищет признаки в хвосте и отбрасывает обработанную часть."""
+
+        text = self._text
+        base = self._base
+        limit = len(text) if final else len(text) - self.overlap
+        if limit <= self._reported - base:
+            return []
+
+        spans = []
+        for category, pattern, group in self.patterns:
+            for match in pattern.finditer(text):
+                start, end = match.span(group)
+                if end > limit:
+                    break
+                if base + end <= self._reported:
+                    continue
+                spans.append(Span(category,
+                                  self._original(base + start),
+                                  self._original(base + end - 1) + 1))
+        spans.sort(key=lambda span: (span.start, span.end))
+        self._reported = base + limit
+
+        keep = max(0, limit - self.overlap)
+        if keep:
+            self._text = text[keep:]
+            self._base = base + keep
+            index = bisect_right(self._norm_starts, self._base) - 1
+            del self._norm_starts[:index]
+            del self._orig_starts[:index]
+        return spans
+
+
+def iter_spans(chunks: Iterable[str],
+               finder: Type[RegionFinder] = RegionFinder,
+               categories: Optional[Sequence[str]] = None,
+               overlap: int = 1024) -> Iterator[Span]:
+    """Ищет признаки адреса в тексте, переданном порциями,
+    и возвращает их позиции в тексте, составленном из порций."""
+
+    scanner = SpanScanner(finder, categories, overlap)
+    for chunk in chunks:
+        yield from scanner.feed(chunk)
+    yield from scanner.close()
+
+
+def scan_file(path: str, encoding: str = 'utf-8',
+              chunk_size: int = 1 << 16,
+              finder: Type[RegionFinder] = RegionFinder,
+              categories: Optional[Sequence[str]] = None,
+              overlap: int = 1024) -> Iterator[Span]:
+    """Ищет признаки адреса в текстовом файле, читая его порциями
+    по chunk_size символов. Позиции - номера символов в файле."""
+
+    with open(path, encoding=encoding, newline='') as stream:
+        yield from iter_spans(iter(lambda: stream.read(chunk_size), ''),
+                              finder, categories, overlap)
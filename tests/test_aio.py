@@ -0,0 +1,78 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from region_finder_ru import RegionFinder
+from region_finder_ru.aio import find_async, find_many_async, iter_find_many
+
+ADDRESSES = ['125212 г. Москва, Ленинградское шоссе',
+             'Ивановской области, Кушвинский район, п. Вурнары',
+             '',
+             'просто текст'] * 10
+
+
+def _run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class TestAsync:
+
+    def test_find_many_async_matches_sync(self):
+        """Результаты совпадают с синхронной пакетной обработкой."""
+
+        with ThreadPoolExecutor(2) as executor:
+            results = _run(find_many_async(ADDRESSES, executor=executor,
+                                           chunk_size=3, max_pending=2))
+
+        assert results == list(RegionFinder.find_many(ADDRESSES))
+
+    def test_async_iterable_input(self):
+        """Адреса можно передавать асинхронным итератором."""
+
+        async def addresses():
+            for address in ADDRESSES:
+                yield address
+
+        async def collect():
+            return [result.region_names
+                    async for result in iter_find_many(addresses(),
+                                                       chunk_size=7)]
+
+        assert _run(collect()) == [result.region_names for result
+                                   in RegionFinder.find_many(ADDRESSES)]
+
+    def test_backpressure(self):
+        """Адреса читаются не дальше max_pending частей вперёд."""
+
+        consumed = []
+
+        def addresses():
+            for address in ADDRESSES:
+                consumed.append(address)
+                yield address
+
+        async def first():
+            iterator = iter_find_many(addresses(), chunk_size=2,
+                                      max_pending=3).__aiter__()
+            result = await iterator.__anext__()
+            await iterator.aclose()
+            return result
+
+        assert _run(first()).region_names == ['москва']
+        assert len(consumed) <= 2 * 3 + 1
+
+    def test_find_async(self):
+        """Одна строка обрабатывается так же, как в find_many."""
+
+        result = _run(find_async('Томская область'))
+
+        assert result.region_names == ['томская']
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            _run(find_many_async(ADDRESSES, chunk_size=0))
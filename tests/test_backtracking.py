@@ -0,0 +1,70 @@
+import time
+
+import pytest
+from region_finder_ru import RegionFinder
+
+LENGTH = 100_000
+TIME_LIMIT = 2.0
+
+ADVERSARIAL = {
+    'letters': 'а' * LENGTH,
+    'letters_before_status': 'а' * LENGTH + ' обл',
+    'letters_before_district': 'а' * LENGTH + ' р',
+    'digits': '1' * LENGTH,
+    'letters_and_digits': 'а1' * (LENGTH // 2),
+    'underscores': 'а_' * (LENGTH // 2),
+    'hyphens': 'а-' * (LENGTH // 2),
+    'city_prefixes': 'г. ' + 'новая ' * (LENGTH // 6),
+}
+
+
+class RegionFinderForTests(RegionFinder):
+
+    def define_regions(self):
+        return -1
+
+
+class LimitedRegionFinder(RegionFinderForTests):
+    max_address_length = 20
+
+
+class TestBacktracking:
+
+    @pytest.mark.parametrize('name', sorted(ADVERSARIAL))
+    def test_adversarial_input_time(self, name):
+        """Поиск на длинных строках без пробелов и дефисов
+        не уходит в экспоненциальный перебор."""
+
+        x = RegionFinderForTests(ADVERSARIAL[name])
+        started = time.perf_counter()
+        x._are_street_attrs_in_address()
+        x._find_postcodes()
+        x._find_region_names()
+        x._find_city_names()
+        x._find_district_names()
+        x._find_settlement_names()
+        RegionFinderForTests(ADVERSARIAL[name]).is_address()
+        x._scan_features()
+        assert time.perf_counter() - started < TIME_LIMIT
+
+    def test_truncate_on_word_boundary(self):
+        """Строка обрезается по последнему пробелу
+        до max_address_length."""
+
+        x = LimitedRegionFinder('Ивановская область, Кушвинский район')
+
+        assert x.address == 'ивановская область,'
+        assert x._find_region_names() == ['ивановская']
+        assert not x._find_district_names()
+
+    def test_truncate_without_spaces(self):
+        """Строка без пробелов обрезается ровно по границе."""
+
+        assert LimitedRegionFinder('а' * 100).address == 'а' * 20
+        assert next(LimitedRegionFinder.find_many(
+            ['а' * 100])).address == 'а' * 20
+
+    def test_no_limit_by_default(self):
+        """По умолчанию длина строки не ограничена."""
+
+        assert RegionFinderForTests('а' * 100).address == 'а' * 100
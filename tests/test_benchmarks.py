@@ -0,0 +1,32 @@
+import os
+import sys
+
+# Пакет benchmarks лежит в корне репозитория, рядом с tests
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+from benchmarks.corpus import CorpusGenerator  # noqa: E402
+from benchmarks.run import compare  # noqa: E402
+
+
+class TestBenchmarks:
+
+    def test_corpus_is_reproducible(self):
+        """Одинаковое зерно даёт одинаковый корпус, разное — разный."""
+
+        corpus = CorpusGenerator(seed=1).generate(200)
+        assert len(corpus) == 200
+        assert CorpusGenerator(seed=1).generate(200) == corpus
+        assert CorpusGenerator(seed=2).generate(200) != corpus
+
+    def test_compare_threshold(self):
+        """Замедление больше порога считается регрессией,
+        замедление в пределах порога и новые замеры — нет."""
+
+        baseline = {'slow': 10.0, 'steady': 10.0}
+        results = {'slow': 13.0, 'steady': 11.5, 'new': 5.0}
+
+        regressions = compare(results, baseline, threshold=0.2)
+        assert len(regressions) == 1
+        assert regressions[0].startswith('slow: 10.00 -> 13.00')
+        assert '+30%' in regressions[0]
+        assert compare(results, baseline, threshold=0.5) == []
@@ -0,0 +1,68 @@
+import pytest
+from region_finder_ru import ExtractionCache, RegionFinder
+
+
+class RegionFinderForTests(RegionFinder):
+
+    def define_regions(self):
+        return -1
+
+
+class TestExtractionCache:
+
+    def test_lru_eviction_and_stats(self):
+        """Давно не использованные результаты вытесняются,
+        счётчики считают попадания, промахи и вытеснения."""
+
+        cache = ExtractionCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        assert cache.get('a') == 1
+        cache.put('c', 3)
+
+        assert cache.get('b') is None
+        assert cache.get('c') == 3
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.evictions) == (2, 1, 1)
+        assert (stats.size, stats.maxsize) == (2, 2)
+        assert stats.hit_rate == pytest.approx(2 / 3)
+
+    def test_invalid_maxsize(self):
+        """Размер кеша должен быть положительным."""
+
+        with pytest.raises(ValueError):
+            ExtractionCache(maxsize=0)
+
+    def test_find_many_with_cache(self):
+        """Повторяющиеся после подготовки адреса берутся из кеша."""
+
+        cache = ExtractionCache(maxsize=10)
+        addresses = ['г. Ижевск', 'Г. ИЖЕВСК', 'г.  Ижевск', 'г. Тюмень']
+
+        results = list(RegionFinder.find_many(addresses, cache=cache))
+
+        assert results == list(RegionFinder.find_many(addresses))
+        stats = cache.stats()
+        assert (stats.hits, stats.misses) == (2, 2)
+
+    def test_cached_results_are_copies(self):
+        """Изменение результата не портит кеш."""
+
+        cache = ExtractionCache()
+        first = next(RegionFinder.find_many(['г. Ижевск'], cache=cache))
+        first.city_names.append('мусор')
+
+        second = next(RegionFinder.find_many(['г. Ижевск'], cache=cache))
+        assert second.city_names == ['ижевск']
+
+    def test_instance_with_cache(self):
+        """Экземпляр класса заполняет результаты поиска из кеша."""
+
+        cache = ExtractionCache()
+        RegionFinderForTests('г. Ижевск', cache=cache)
+        x = RegionFinderForTests('г. Ижевск', cache=cache)
+
+        assert x._find_city_names() == ['ижевск']
+        assert x.is_address()
+        assert cache.stats().hits == 1
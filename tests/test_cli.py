@@ -0,0 +1,102 @@
+import csv
+import json
+
+from region_finder_ru.cli import main
+
+ADDRESSES = ['125212 г. Москва, Ленинградское шоссе',
+             '',
+             'Ивановской области, Кушвинский район',
+             'Трикотажная 49/1',
+             'п. Вурнары'] * 7
+
+
+class TestCli:
+
+    def test_csv_in_order(self, tmp_path, capsys):
+        """Результаты CSV записываются в порядке входных строк
+        при обработке в нескольких процессах."""
+
+        source = tmp_path / 'in.csv'
+        with open(str(source), 'w', encoding='utf-8', newline='') as stream:
+            writer = csv.writer(stream)
+            writer.writerow(['id', 'address'])
+            writer.writerows(enumerate(ADDRESSES))
+        target = tmp_path / 'out.csv'
+
+        assert main([str(source), '-o', str(target),
+                     '--workers', '2', '--chunk-size', '3']) == 0
+
+        with open(str(target), encoding='utf-8', newline='') as stream:
+            rows = list(csv.DictReader(stream))
+        assert [row['id'] for row in rows] == [
+            str(i) for i in range(len(ADDRESSES))]
+        assert rows[0]['first_3_postcodes'] == '125'
+        assert rows[1]['error'] == 'Адрес не должен быть пустым'
+        assert rows[2]['region_names'] == 'ивановская'
+        assert rows[3]['is_address'] == 'False'
+        assert 'строк/с' in capsys.readouterr().err
+
+    def test_jsonl(self, tmp_path, capsys):
+        """Результаты JSONL совпадают при обработке в одном
+        и нескольких процессах."""
+
+        source = tmp_path / 'in.jsonl'
+        source.write_text(''.join(
+            json.dumps({'id': i, 'text': address}, ensure_ascii=False) + '\n'
+            for i, address in enumerate(ADDRESSES)), encoding='utf-8')
+
+        outputs = []
+        for workers in ('1', '3'):
+            target = tmp_path / 'out{}.jsonl'.format(workers)
+            assert main([str(source), '-o', str(target), '-c', 'text',
+                         '-w', workers, '-s', '4']) == 0
+            outputs.append(target.read_text(encoding='utf-8'))
+
+        assert outputs[0] == outputs[1]
+        records = [json.loads(line) for line in outputs[0].splitlines()]
+        assert len(records) == len(ADDRESSES)
+        assert records[4]['settlement_names'] == ['вурнары']
+
+    def test_missing_column(self, tmp_path, capsys):
+        """Без колонки с адресом обработка не начинается."""
+
+        source = tmp_path / 'in.csv'
+        source.write_text('id,text\n1,г. Ижевск\n', encoding='utf-8')
+
+        assert main([str(source), '-o', str(tmp_path / 'out.csv')]) == 2
+        assert 'address' in capsys.readouterr().err
+
+    def test_jsonl_malformed_line(self, tmp_path, capsys):
+        """Строка JSONL, которая не разбирается, завершает обработку
+        с кодом 2 и номером строки."""
+
+        source = tmp_path / 'in.jsonl'
+        source.write_text('{"address": "г. Томск"}\nnot json\n',
+                          encoding='utf-8')
+
+        assert main([str(source), '-o', str(tmp_path / 'out.jsonl'),
+                     '-w', '1']) == 2
+        assert 'Строка 2' in capsys.readouterr().err
+
+    def test_jsonl_not_object(self, tmp_path, capsys):
+        """Строка JSONL, которая не является объектом, завершает
+        обработку с кодом 2 и номером строки."""
+
+        source = tmp_path / 'in.jsonl'
+        source.write_text('"г. Томск"\n', encoding='utf-8')
+
+        assert main([str(source), '-o', str(tmp_path / 'out.jsonl'),
+                     '-w', '2']) == 2
+        assert 'Строка 1' in capsys.readouterr().err
+
+    def test_csv_extra_fields(self, tmp_path, capsys):
+        """Строка CSV с лишними полями завершает обработку с кодом 2
+        и номером строки."""
+
+        source = tmp_path / 'in.csv'
+        source.write_text('id,address\n1,г. Томск\n2,"г. Ижевск",extra\n',
+                          encoding='utf-8')
+
+        assert main([str(source), '-o', str(tmp_path / 'out.csv'),
+                     '-w', '1']) == 2
+        assert 'Строка 3' in capsys.readouterr().err
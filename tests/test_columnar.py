@@ -0,0 +1,60 @@
+import pytest
+
+from region_finder_ru import RegionFinder
+from region_finder_ru.columnar import COLUMNS, _extract_unique
+
+ADDRESSES = ['634050 г. Томск, ул. Ленина', None,
+             'Ивановской области, Кушвинский район, п. Вурнары',
+             '634050 г. Томск, ул. Ленина', '']
+
+
+class TestColumnar:
+
+    def test_extract_unique(self):
+        """Колонки совпадают с результатами find_many."""
+
+        addresses = [address for address in ADDRESSES if address is not None]
+        columns = _extract_unique(addresses)
+        results = list(RegionFinder.find_many(addresses))
+
+        assert tuple(columns) == COLUMNS
+        assert columns['postcode'] == ['634050', None, '634050', None]
+        assert columns['region'][1] == results[1].region_names[0]
+        assert columns['is_address'] == [result.is_address()
+                                         for result in results]
+
+    def test_extract_series(self):
+        pd = pytest.importorskip('pandas')
+        from region_finder_ru.columnar import extract_series
+
+        frame = extract_series(pd.Series(ADDRESSES, index=list('abcde')))
+
+        assert list(frame.columns) == list(COLUMNS)
+        assert list(frame.index) == list('abcde')
+        assert frame.loc['a', 'prefix'] == '634'
+        assert frame.loc['c', 'settlement'] == 'вурнары'
+        assert frame.loc['d', 'city'] == 'томск'
+        assert frame.loc['b'].isna().all()
+        assert not frame.loc['e', 'is_address']
+        assert str(frame['is_address'].dtype) == 'boolean'
+
+    def test_extract_series_all_null(self):
+        pd = pytest.importorskip('pandas')
+        from region_finder_ru.columnar import extract_series
+
+        frame = extract_series(pd.Series([None, None], dtype=object))
+
+        assert frame.isna().all().all()
+
+    def test_extract_arrow(self):
+        pa = pytest.importorskip('pyarrow')
+        from region_finder_ru.columnar import extract_arrow
+
+        table = extract_arrow(pa.chunked_array([ADDRESSES[:2],
+                                                ADDRESSES[2:]]))
+
+        assert table.column_names == list(COLUMNS)
+        assert table.column('region').to_pylist() == [
+            None, None, 'ивановская', None, None]
+        assert table.column('is_address').to_pylist() == [
+            True, None, True, True, False]
@@ -0,0 +1,33 @@
+from region_finder_ru import CompactBatch, CompactRow
+from region_finder_ru.compact import HAS_CITY, HAS_STREET, IS_ADDRESS
+
+
+class TestCompactBatch:
+
+    def test_codes_and_flags(self):
+        """Индексы и регионы сохраняются числами, признаки - флагами."""
+
+        batch = CompactBatch.from_addresses(
+            ['634050 г. Томск, ул. Ленина', 'Ивановской области',
+             'просто текст', ''])
+
+        assert len(batch) == 4
+        assert batch[0] == CompactRow(postcode=634050, postcode_region=70,
+                                      name_region=0,
+                                      flags=HAS_STREET | HAS_CITY
+                                      | IS_ADDRESS)
+        assert batch[0].region == 70
+        assert batch[1].region == 37
+        assert batch[1].is_address()
+        assert not batch[2].is_address()
+        assert batch[3].error
+
+    def test_fixed_row_size(self):
+        """Объём памяти не зависит от длины адресов."""
+
+        short = CompactBatch.from_addresses(['г. Томск'] * 100)
+        long = CompactBatch.from_addresses(
+            ['г. Томск, ' + 'улица Ленина, ' * 50] * 100)
+
+        assert short.nbytes() == long.nbytes()
+        assert [row.region for row in long] == [0] * 100
@@ -0,0 +1,63 @@
+import threading
+
+import pytest
+
+from region_finder_ru import ExtractionCache, Extractor, RegionFinder
+
+TEMPLATES = ['{} г. Томск, ул. Ленина, д. {}',
+             'Ивановской области, Кушвинский район, п. Вурнары, д. {1}',
+             'Республика Татарстан, {0}, с. Высокая Гора',
+             'просто текст {1}', '']
+ADDRESSES = [template.format(634000 + index % 300, index)
+             for index in range(400) for template in TEMPLATES]
+
+
+class TestExtractor:
+
+    def test_extract_matches_find_many(self):
+        extractor = Extractor()
+
+        assert ([extractor.extract(address) for address in ADDRESSES[:50]]
+                == list(RegionFinder.find_many(ADDRESSES[:50])))
+
+    def test_map_keeps_order(self):
+        """Пакетная обработка в пуле потоков возвращает результаты
+        в порядке входных строк."""
+
+        results = list(Extractor().map(iter(ADDRESSES), workers=4,
+                                       chunk_size=37))
+
+        assert results == list(RegionFinder.find_many(ADDRESSES))
+        with pytest.raises(ValueError):
+            list(Extractor().map(ADDRESSES, workers=0))
+
+    def test_concurrent_stress(self):
+        """Один объект с общим кешем из многих потоков даёт
+        те же результаты, что и последовательная обработка."""
+
+        expected = list(RegionFinder.find_many(ADDRESSES))
+        cache = ExtractionCache(maxsize=500)
+        extractor = Extractor(cache=cache)
+        barrier = threading.Barrier(8)
+        failures = []
+
+        def work(offset):
+            barrier.wait()
+            order = ADDRESSES[offset:] + ADDRESSES[:offset]
+            for index, address in enumerate(order):
+                position = (index + offset) % len(ADDRESSES)
+                if extractor.extract(address) != expected[position]:
+                    failures.append(address)
+
+        threads = [threading.Thread(target=work, args=(offset * 250,))
+                   for offset in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not failures
+        stats = cache.stats()
+        # Пустые строки не попадают в кеш
+        assert stats.hits + stats.misses == 8 * sum(map(bool, ADDRESSES))
+        assert stats.size <= 500
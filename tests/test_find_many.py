@@ -0,0 +1,39 @@
+from region_finder_ru import AddressResult, RegionFinder
+
+
+class TestFindMany:
+
+    def test_find_many_results(self):
+        """Пакетная обработка возвращает те же признаки,
+        что и методы экземпляра класса."""
+
+        addresses = ['125212 г. Москва, Ленинградское шоссе',
+                     'Ивановской области, Кушвинский район, п. Вурнары']
+
+        results = list(RegionFinder.find_many(addresses))
+
+        assert results[0] == AddressResult(
+            address='125212 г. москва, ленинградское шоссе',
+            postcodes=['125212'],
+            first_3_postcodes=['125'],
+            region_names=['москва'],
+            city_names=['москва'],
+            district_names=[],
+            settlement_names=[],
+            has_street=True,
+        )
+        assert results[1].region_names == ['ивановская']
+        assert results[1].district_names == ['кушвинский']
+        assert results[1].settlement_names == ['вурнары']
+        assert all(result.is_address() for result in results)
+
+    def test_find_many_empty_address(self):
+        """Пустая строка возвращается с ошибкой
+        и не прерывает обработку набора."""
+
+        results = list(RegionFinder.find_many(['', 'Трикотажная 49/1']))
+
+        assert results[0].error == 'Адрес не должен быть пустым'
+        assert not results[0].is_address()
+        assert results[1].error is None
+        assert not results[1].is_address()
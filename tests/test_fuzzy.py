@@ -0,0 +1,67 @@
+from region_finder_ru import FuzzyIndex, FuzzyMatch, InMemoryRegionFinder
+from region_finder_ru import fuzzy
+
+
+class TestFuzzyIndex:
+
+    def test_lookup_with_typos(self):
+        """Названия с опечатками находятся в пределах допустимого
+        количества правок."""
+
+        index = FuzzyIndex.default()
+
+        assert index.lookup('новосибрск') == [
+            FuzzyMatch('city', 'новосибирск', 54, 1)]
+        assert index.lookup('свердловкая', 'region') == [
+            FuzzyMatch('region', 'свердловская', 66, 1)]
+        assert index.lookup('томск', 'city')[0].distance == 0
+        assert not index.lookup('свердловкая', 'city')
+
+    def test_distance_limits(self):
+        """Короткие слова ищутся только точно, перестановка соседних
+        символов - одна правка."""
+
+        index = FuzzyIndex([('city', 'Уфа', 2), ('city', 'Томск', 70),
+                            ('city', 'Архангельск', 29)])
+
+        assert not index.lookup('уфы')
+        assert index.lookup('тосмк')[0].distance == 1
+        assert index.lookup('арханглеск')[0].distance == 2
+        assert not index.lookup('арханглеск', max_distance=1)
+        assert not index.lookup('охотск')
+
+    def test_long_words_skipped(self, monkeypatch):
+        """Слова длиннее самого длинного названия больше, чем
+        на допустимое число правок, не ищутся."""
+
+        index = FuzzyIndex([('city', 'Томск', 70),
+                            ('city', 'Архангельск', 29)])
+        assert index.lookup('архангельскии')[0].distance == 2
+
+        def fail(word, distance):
+            raise AssertionError('варианты слова не нужны')
+
+        monkeypatch.setattr(fuzzy, '_deletes', fail)
+        assert not index.lookup('архангельскиий')
+        assert not InMemoryRegionFinder(
+            'г. ' + 'а' * 800, fuzzy=index).define_regions()
+
+    def test_define_regions_with_fuzzy(self):
+        """Нераспознанные названия регионов и городов ищутся
+        с опечатками только при переданном справочнике."""
+
+        address = 'Свердловкая область, г. Новосибрск'
+
+        assert not InMemoryRegionFinder(address).define_regions()
+        assert [region.code for region in InMemoryRegionFinder(
+            address, fuzzy=FuzzyIndex.default()).define_regions()] == [66, 54]
+
+    def test_resolve_with_fuzzy(self):
+        """Признаки с опечатками участвуют в поэтапном определении."""
+
+        resolution = InMemoryRegionFinder(
+            'Новосибрская область, г. Новосибрск',
+            fuzzy=FuzzyIndex.default()).resolve()
+
+        assert resolution.region.code == 54
+        assert resolution.tier == 'city'
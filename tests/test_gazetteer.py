@@ -0,0 +1,86 @@
+from region_finder_ru import Gazetteer, GazetteerMatch, InMemoryRegionFinder
+from region_finder_ru import RegionFinder
+
+
+def find(gazetteer, address):
+    return [(match.kind, match.name, match.code) for match in gazetteer.find(
+        RegionFinder._beatify_address(address))]
+
+
+class TestGazetteer:
+
+    def test_names_without_markers(self):
+        """Названия находятся без признаков "г.", "с." и статусов."""
+
+        gazetteer = Gazetteer.default()
+
+        assert find(gazetteer, 'Томск, Чувашия, Вурнары') == [
+            ('city', 'томск', 70),
+            ('region', 'чувашия', 21),
+            ('settlement', 'вурнары', 21),
+        ]
+
+    def test_word_boundaries(self):
+        """Названия внутри других слов не засчитываются,
+        а из пересекающихся выбирается самое длинное."""
+
+        gazetteer = Gazetteer([('city', 'Ростов', 76),
+                               ('city', 'Ростов-на-Дону', 61),
+                               ('city', 'Нижний Новгород', 52),
+                               ('city', 'Новгород', 53)])
+
+        assert find(gazetteer, 'Ростов-на-Дону, Ростовская, Ростов') == [
+            ('city', 'ростов-на-дону', 61),
+            ('city', 'ростов', 76),
+        ]
+        assert find(gazetteer, 'Нижний Новгород, Новгород') == [
+            ('city', 'нижний новгород', 52),
+            ('city', 'новгород', 53),
+        ]
+
+    def test_spans_and_ambiguous_names(self):
+        """Для названия возвращаются позиции и все записи справочника."""
+
+        gazetteer = Gazetteer([('city', 'Благовещенск', 28),
+                               ('city', 'Благовещенск', 2)])
+
+        assert gazetteer.find('г. благовещенск') == [
+            GazetteerMatch('city', 'благовещенск', 28, 3, 15),
+            GazetteerMatch('city', 'благовещенск', 2, 3, 15),
+        ]
+
+    def test_define_regions_with_gazetteer(self):
+        """InMemoryRegionFinder дополняет регионы по справочнику."""
+
+        address = 'Набережные Челны, Ленина 1'
+
+        assert not InMemoryRegionFinder(address).define_regions()
+        assert [region.code for region in InMemoryRegionFinder(
+            address, gazetteer=Gazetteer.default()).define_regions()] == [16]
+
+    def test_codes(self):
+        """Коды субъектов ищутся по виду и названию объекта."""
+
+        gazetteer = Gazetteer([('city', 'Кировск', 47),
+                               ('city', 'Кировск', 51),
+                               ('settlement', 'Вурнары', 21)])
+
+        assert gazetteer.codes('кировск', 'city') == [47, 51]
+        assert gazetteer.codes('вурнары', 'city') == []
+
+    def test_ambiguous_names_need_marker(self):
+        """Названия, совпадающие с обычными словами, именами
+        и фамилиями, засчитываются только после признака."""
+
+        gazetteer = Gazetteer.default()
+
+        assert find(gazetteer, 'Иванов Владимир Петрович, г. Томск') == [
+            ('city', 'томск', 70),
+        ]
+        assert not find(gazetteer, 'Шахты, оплата, Орел и решка')
+        assert find(gazetteer, 'г. Владимир, город Шахты, г.Орел') == [
+            ('city', 'владимир', 33),
+            ('city', 'шахты', 61),
+            ('city', 'орел', 57),
+        ]
+        assert not find(gazetteer, 'Дог. Орел')
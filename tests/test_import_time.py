@@ -0,0 +1,57 @@
+import subprocess
+import sys
+
+from region_finder_ru import InMemoryRegionFinder, RegionFinder
+
+# Модули, которые не должны загружаться при импорте пакета
+HEAVY_MODULES = ('sqlite3', 'json', 'concurrent.futures', 'asyncio',
+                 'http.server', 'region_finder_ru.reference',
+                 'region_finder_ru.server')
+
+
+def _run(script: str) -> str:
+    return subprocess.run([sys.executable, '-c', script], check=True,
+                          stdout=subprocess.PIPE,
+                          universal_newlines=True).stdout
+
+
+class TestImportTime:
+
+    def test_import_is_lazy(self):
+        """Импорт пакета не загружает подмодули и необязательные
+        зависимости стандартной библиотеки."""
+
+        output = _run('import sys, region_finder_ru\n'
+                      'print(" ".join(sys.modules))')
+        loaded = set(output.split())
+        assert not loaded & set(HEAVY_MODULES)
+
+    def test_patterns_compiled_on_first_use(self):
+        """Регулярные выражения компилируются при первом обращении."""
+
+        output = _run(
+            'from region_finder_ru import RegionFinder\n'
+            'lazy = RegionFinder.__dict__["_postcode_regex"]\n'
+            'print(lazy._compiled is None)\n'
+            'RegionFinder._postcode_regex\n'
+            'print(lazy._compiled is None)')
+        assert output.split() == ['True', 'False']
+
+    def test_exports(self):
+        """Экспортируемые имена доступны через атрибуты пакета."""
+
+        import region_finder_ru
+
+        for name in region_finder_ru.__all__:
+            assert getattr(region_finder_ru, name) is not None
+        assert set(region_finder_ru.__all__) <= set(dir(region_finder_ru))
+
+    def test_warm_up(self):
+        """После warm_up поиск не компилирует выражений
+        и не загружает справочники."""
+
+        InMemoryRegionFinder.warm_up()
+        lazy = RegionFinder.__dict__['_region_name_regex']
+        assert lazy._compiled is not None
+        result = InMemoryRegionFinder('634050 г. Томск').define_regions()
+        assert [region.code for region in result] == [70]
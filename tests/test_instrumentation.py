@@ -0,0 +1,95 @@
+import pytest
+
+from region_finder_ru import RegionFinder
+from region_finder_ru.instrumentation import (HISTOGRAM_BUCKETS,
+                                              Instrumentation,
+                                              prometheus_text)
+
+ADDRESSES = ['634050 г. Томск, ул. Ленина', 'Ивановской области',
+             'просто текст']
+
+
+class RegionFinderForTests(RegionFinder):
+
+    def define_regions(self):
+        return -1
+
+
+class TestInstrumentation:
+
+    def test_counts_patterns_and_methods(self):
+        """Считаются вызовы и совпадения регулярных выражений
+        и методов поиска."""
+
+        with Instrumentation(RegionFinderForTests) as instrumentation:
+            results = list(RegionFinderForTests.find_many(ADDRESSES))
+            finder = RegionFinderForTests(ADDRESSES[0])
+            assert finder._find_postcodes() == ['634050']
+
+        snapshot = instrumentation.snapshot()
+        postcodes = snapshot.patterns['_postcode_regex']
+        assert postcodes.calls == 2
+        assert postcodes.matches == 2
+        assert sum(postcodes.histogram) == postcodes.calls
+        assert postcodes.max_time <= postcodes.total_time
+        assert snapshot.methods['_find_postcodes'].calls == 1
+        assert snapshot.methods['_region_names_in'].calls == 3
+        assert snapshot.methods['_region_names_in'].matches == 1
+        assert results == list(RegionFinderForTests.find_many(ADDRESSES))
+
+    def test_counts_is_address(self):
+        """is_address замеряется вместе с регулярными выражениями,
+        которые он запускает."""
+
+        with Instrumentation(RegionFinderForTests) as instrumentation:
+            for _ in range(100):
+                assert RegionFinderForTests(ADDRESSES[1]).is_address()
+
+        snapshot = instrumentation.snapshot()
+        assert snapshot.methods['is_address'].calls == 100
+        assert snapshot.methods['is_address'].matches == 100
+        assert snapshot.patterns['_street_regex'].calls == 100
+        assert snapshot.patterns['_region_name_regex'].calls == 100
+        assert snapshot.patterns['_city_name_regex'].calls == 0
+
+    def test_disable_restores_attributes(self):
+        """После выключения атрибуты класса - исходные объекты."""
+
+        pattern = RegionFinderForTests._postcode_regex
+        method = RegionFinderForTests._find_postcodes
+        version = RegionFinderForTests.patterns_version()
+
+        instrumentation = Instrumentation(RegionFinderForTests)
+        instrumentation.enable()
+        assert RegionFinderForTests._postcode_regex is not pattern
+        assert RegionFinderForTests.patterns_version() == version
+        with pytest.raises(RuntimeError):
+            Instrumentation(RegionFinderForTests).enable()
+        instrumentation.disable()
+
+        assert RegionFinderForTests._postcode_regex is pattern
+        assert RegionFinderForTests._find_postcodes is method
+        assert '_postcode_regex' not in vars(RegionFinderForTests)
+
+    def test_exporters(self):
+        """Счётчики передаются получателям и в формате Prometheus."""
+
+        exported = []
+        instrumentation = Instrumentation(RegionFinderForTests,
+                                          exporters=[exported.append])
+        with instrumentation:
+            RegionFinderForTests('г. Томск')._find_city_names()
+        instrumentation.export()
+
+        assert exported == [instrumentation.snapshot()]
+        text = prometheus_text(exported[0])
+        assert ('region_finder_pattern_seconds_count'
+                '{name="_city_name_regex"} 1') in text
+        assert ('region_finder_method_seconds_bucket'
+                '{name="_find_city_names",le="+Inf"} 1') in text
+        assert len(HISTOGRAM_BUCKETS) + 1 == len(
+            exported[0].patterns['_city_name_regex'].histogram)
+
+        instrumentation.reset()
+        methods = instrumentation.snapshot().methods
+        assert methods['_find_city_names'].calls == 0
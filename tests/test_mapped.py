@@ -0,0 +1,49 @@
+import pytest
+from region_finder_ru import (InMemoryRegionFinder, MappedReferenceData,
+                              ReferenceData, compile_reference)
+
+
+@pytest.fixture
+def reference_path(tmp_path):
+    path = str(tmp_path / 'reference.bin')
+    compile_reference(path)
+    return path
+
+
+class TestMappedReferenceData:
+
+    def test_same_answers_as_reference_data(self, reference_path):
+        """Ответы совпадают со справочниками в памяти."""
+
+        reference = ReferenceData.default()
+        with MappedReferenceData(reference_path) as mapped:
+            for prefix in range(1000):
+                prefix = '{:03d}'.format(prefix)
+                assert (mapped.region_by_prefix(prefix)
+                        == reference.region_by_prefix(prefix))
+            for postcode in ('142169', '142170', '142172', '142173',
+                             '142191', '634009', '000000', '999999'):
+                assert (mapped.region_by_postcode(postcode)
+                        == reference.region_by_postcode(postcode))
+            for name in ('татарстан', 'марий эл', 'ханты-мансийский',
+                         'якутия', 'автономная', 'я'):
+                assert (mapped.region_by_name(name)
+                        == reference.region_by_name(name))
+
+    def test_in_memory_region_finder(self, reference_path):
+        """Файл справочников можно передать в InMemoryRegionFinder."""
+
+        address = '634009, Томская обл., Республика Татарстан'
+        with MappedReferenceData(reference_path) as mapped:
+            assert (InMemoryRegionFinder(address,
+                                         reference=mapped).define_regions()
+                    == InMemoryRegionFinder(address).define_regions())
+
+    def test_wrong_file(self, tmp_path):
+        """Файл другого формата не открывается."""
+
+        path = tmp_path / 'wrong.bin'
+        path.write_bytes(b'x' * 100)
+
+        with pytest.raises(ValueError):
+            MappedReferenceData(str(path))
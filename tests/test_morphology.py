@@ -0,0 +1,52 @@
+from region_finder_ru.morphology import (decline_phrase, decline_word,
+                                         inflections_version,
+                                         region_inflections)
+from region_finder_ru.reference import REGIONS_CSV
+
+
+class TestMorphology:
+
+    def test_decline_adjectives(self):
+        """Прилагательные склоняются по окончанию."""
+
+        assert decline_word('томская') == ['томская', 'томской', 'томской',
+                                           'томскую', 'томской', 'томской']
+        assert decline_word('ханты-мансийский')[1] == 'ханты-мансийского'
+
+    def test_decline_nouns(self):
+        """Существительные склоняются по окончанию,
+        несклоняемые остаются без изменений."""
+
+        assert decline_word('татарстан')[5] == 'татарстане'
+        assert decline_word('севастополь')[4] == 'севастополем'
+        assert decline_word('кубань')[4] == 'кубанью'
+        assert decline_word('коми') == ['коми'] * 6
+
+    def test_decline_phrase(self):
+        """В названиях из нескольких слов склоняется каждое слово."""
+
+        assert decline_phrase('северная осетия')[1] == 'северной осетии'
+        assert decline_phrase('марий эл') == ['марий эл'] * 6
+
+    def test_region_inflections(self):
+        """Таблица сопоставляет формы названий ключам справочника."""
+
+        inflections = region_inflections()
+
+        assert inflections['татарстане'] == 'татарстан'
+        assert inflections['москвы'] == 'москва'
+        assert inflections['приморского'] == 'приморский'
+
+    def test_inflections_version(self, tmp_path):
+        """Хеш таблицы меняется при изменении файла регионов."""
+
+        path = tmp_path / 'regions.csv'
+        with open(REGIONS_CSV, encoding='utf-8') as stream:
+            data = stream.read()
+        path.write_text(data, encoding='utf-8')
+        assert inflections_version(str(path)) == inflections_version()
+
+        path = tmp_path / 'changed.csv'
+        path.write_text(data.replace(',татарстан', ',татария'),
+                        encoding='utf-8')
+        assert inflections_version(str(path)) != inflections_version()
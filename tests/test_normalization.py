@@ -0,0 +1,44 @@
+from region_finder_ru import RegionFinder, normalize_address
+
+
+class RegionFinderForTests(RegionFinder):
+
+    def define_regions(self):
+        return -1
+
+
+class TestNormalization:
+
+    def test_spaces(self):
+        """Последовательности любых пробельных символов, в том числе
+        неразрывных пробелов, заменяются одним пробелом."""
+
+        assert normalize_address(
+            ' 125212\xa0\xa0Ленинградское  \tшоссе\n') == (
+            '125212 ленинградское шоссе')
+
+    def test_letters_dashes_and_punctuation(self):
+        """Буква ё заменяется на е, тире - на дефис, кавычки - на
+        пробел, символы нулевой ширины удаляются."""
+
+        assert normalize_address(
+            'Ёлкино, Северная Осетия — Алания, «Ро­стов‑на–Дону»'
+        ) == 'елкино, северная осетия - алания, ростов-на-дону'
+
+    def test_nbsp_runs_do_not_break_matches(self):
+        """Несколько неразрывных пробелов подряд не мешают поиску."""
+
+        x = RegionFinderForTests('Томская\xa0\xa0область, г.\xa0\xa0Томск')
+
+        assert x._find_region_names() == ['томская']
+        assert x._find_city_names() == ['томск']
+
+    def test_quotes_do_not_glue_words(self):
+        """Кавычка между словами без пробела не склеивает их."""
+
+        x = RegionFinderForTests('ЖК "Солнечный"г. Томск')
+        assert x.address == 'жк солнечный г. томск'
+        assert x._find_city_names() == ['томск']
+
+        x = RegionFinderForTests('ТЦ «Мега»ул. Ленина')
+        assert x._are_street_attrs_in_address()
@@ -0,0 +1,93 @@
+import os
+import re
+
+import region_finder_ru as region_finder_ru_package
+from region_finder_ru import RegionFinder, SqliteExtractionCache
+from region_finder_ru import region_finder_ru
+
+
+class RegionFinderForTests(RegionFinder):
+
+    def define_regions(self):
+        return -1
+
+
+class ChangedRegionFinder(RegionFinderForTests):
+    _city_name_regex = RegionFinder._district_regex
+
+
+class TestSqliteExtractionCache:
+
+    def test_results_survive_reopen(self, tmp_path):
+        """Результаты сохраняются между запусками."""
+
+        path = str(tmp_path / 'cache.sqlite')
+        addresses = ['125212 г. Москва, Ленинградское шоссе', 'г. Ижевск']
+
+        with SqliteExtractionCache(path) as cache:
+            first = list(RegionFinder.find_many(addresses, cache=cache))
+
+        with SqliteExtractionCache(path) as cache:
+            second = list(RegionFinder.find_many(addresses, cache=cache))
+            assert cache.stats().hits == 2
+            assert cache.stats().misses == 0
+            assert cache.stats().size == 2
+            assert cache.stats().maxsize == 0
+
+        assert first == second
+
+    def test_pattern_change_invalidates_entries(self, tmp_path):
+        """При изменении регулярных выражений записи не используются."""
+
+        path = str(tmp_path / 'cache.sqlite')
+
+        assert (RegionFinder.patterns_version()
+                != ChangedRegionFinder.patterns_version())
+
+        with SqliteExtractionCache(path) as cache:
+            list(RegionFinder.find_many(['г. Ижевск'], cache=cache))
+            x = ChangedRegionFinder('г. Ижевск', cache=cache)
+            assert cache.stats().misses == 2
+            assert x._find_city_names() == []
+
+            assert cache.purge(ChangedRegionFinder.patterns_version()) == 1
+            assert len(cache) == 1
+
+    def test_region_tables_change_version(self, monkeypatch):
+        """Версия меняется при изменении окончаний прилагательных
+        и таблицы падежных форм."""
+
+        class ChangedEndingsFinder(RegionFinderForTests):
+            _region_adjective_endings = (('ой', 'ая'),)
+
+        version = RegionFinderForTests.patterns_version()
+        assert ChangedEndingsFinder.patterns_version() != version
+
+        monkeypatch.setattr(region_finder_ru, 'inflections_version',
+                            lambda: 'changed')
+        assert RegionFinderForTests.patterns_version() != version
+
+    def test_class_and_package_change_version(self, monkeypatch):
+        """У наследника с переопределённым методом поиска
+        и у другой версии пакета свои записи."""
+
+        class ChangedMethodFinder(RegionFinderForTests):
+
+            @classmethod
+            def _city_names_in(cls, address):
+                return []
+
+        version = RegionFinderForTests.patterns_version()
+        assert ChangedMethodFinder.patterns_version() != version
+
+        monkeypatch.setattr(region_finder_ru, '_package_version', '0.0.0')
+        assert RegionFinderForTests.patterns_version() != version
+
+    def test_package_version_matches_pyproject(self):
+        """Версия пакета совпадает с версией в pyproject.toml."""
+
+        path = os.path.join(os.path.dirname(__file__), os.pardir,
+                            'pyproject.toml')
+        with open(path, encoding='utf-8') as stream:
+            match = re.search(r'^version = "(.+)"$', stream.read(), re.M)
+        assert match.group(1) == region_finder_ru_package.__version__
@@ -0,0 +1,121 @@
+import pytest
+from region_finder_ru import (Gazetteer, InMemoryRegionFinder, ReferenceData,
+                              Region)
+
+
+class TestReferenceData:
+
+    def test_region_by_postcode(self):
+        """Регион определяется по первым трём цифрам индекса,
+        а исключения - по полному индексу."""
+
+        reference = ReferenceData.default()
+
+        assert reference.region_by_postcode('634009').code == 70
+        assert reference.region_by_prefix('634').code == 70
+        assert reference.region_by_postcode('142100').code == 50
+        assert reference.region_by_postcode('142191').code == 77
+        assert reference.region_by_postcode('000000') is None
+
+    def test_region_by_name(self):
+        """Регион определяется по названию из _find_region_names."""
+
+        reference = ReferenceData.default()
+
+        assert reference.region_by_name('татарстан') == Region(
+            16, 'Республика Татарстан')
+        assert reference.region_by_name('чувашия').code == 21
+        assert reference.region_by_name('северная осетия').code == 15
+        assert reference.region_by_name('автономная') is None
+
+    def test_unknown_region_code(self):
+        """Диапазон индексов должен ссылаться на известный субъект."""
+
+        with pytest.raises(ValueError):
+            ReferenceData([(1, 'Республика Адыгея', ['адыгея'])],
+                          [('385', '385', 2)])
+
+    def test_default_is_loaded_once(self):
+        """Справочники пакета загружаются один раз."""
+
+        assert ReferenceData.default() is ReferenceData.default()
+
+
+class TestInMemoryRegionFinder:
+
+    def test_define_regions(self):
+        """Регионы определяются по индексам и названиям без повторов."""
+
+        address = ('634009, Томская обл., г. Томск, 634050,'
+                   ' Республика Татарстан, Ивановской области')
+
+        assert [region.code for region in InMemoryRegionFinder(
+            address).define_regions()] == [70, 16, 37]
+
+    def test_define_regions_custom_reference(self):
+        """Можно передать собственные справочники."""
+
+        reference = ReferenceData([(1, 'Республика Адыгея', ['адыгея'])],
+                                  [('385', '385', 1)])
+
+        assert InMemoryRegionFinder('385000 Майкоп',
+                                    reference=reference).define_regions() == [
+            Region(1, 'Республика Адыгея')]
+        assert not InMemoryRegionFinder('634009 Томск',
+                                        reference=reference).define_regions()
+
+    def test_resolve_stops_at_postcode(self):
+        """Почтового индекса достаточно, остальные ступени
+        не выполняются."""
+
+        finder = InMemoryRegionFinder('634050, Ивановская область, г. Томск',
+                                      gazetteer=Gazetteer.default())
+        resolution = finder.resolve()
+
+        assert resolution.region.code == 70
+        assert resolution.tier == 'postcode'
+        assert (resolution.stages_run, resolution.stages_skipped) == (1, 4)
+        assert '_find_city_names' not in finder._memo
+
+    def test_resolve_combines_tiers(self):
+        """Признаки разных ступеней складываются до порога."""
+
+        resolution = InMemoryRegionFinder(
+            'Томская область, г. Томск',
+            gazetteer=Gazetteer.default()).resolve()
+
+        assert resolution.region.code == 70
+        assert resolution.tier == 'city'
+        assert resolution.confidence == pytest.approx(0.92)
+
+    def test_resolve_conflicting_postcodes(self):
+        """Противоречащие признаки не останавливают поиск: регион
+        определяется, только когда один субъект опережает остальные."""
+
+        resolution = InMemoryRegionFinder('634050, 125212').resolve()
+
+        assert resolution.scores == {70: 0.9, 77: 0.9}
+        assert resolution.region is None
+        assert resolution.tier is None
+        assert resolution.stages_skipped == 0
+
+        resolution = InMemoryRegionFinder(
+            '634050, 125212, Томская область').resolve()
+
+        assert resolution.region.code == 70
+        assert resolution.tier == 'region'
+
+    def test_resolve_below_threshold(self):
+        """Если порог не достигнут, возвращается лучший регион
+        без ступени."""
+
+        resolution = InMemoryRegionFinder('Томская область').resolve()
+
+        assert resolution.region.code == 70
+        assert resolution.tier is None
+        assert resolution.stages_skipped == 0
+        assert InMemoryRegionFinder('Томская область').resolve(
+            threshold=0.8).tier == 'region'
+        assert InMemoryRegionFinder('текст').resolve().region is None
+        with pytest.raises(ValueError):
+            InMemoryRegionFinder('текст').resolve(threshold=0)
@@ -1,3 +1,5 @@
+import re
+
 import pytest
 from region_finder_ru import RegionFinder
 
@@ -214,6 +216,37 @@ class TestRegion:
                                           'северная осетия']
                 )
 
+    def test_find_region_names_cases(self):
+        """Названия регионов в косвенных падежах приводятся
+        к именительному падежу."""
+
+        address = ('г. Казань, республике Татарстан,'
+                   'Сургут Ханты-Мансийского автономного округа - Югры,'
+                   'по Краснодарскому краю, в Томскую область,'
+                   'в Алтайском крае, Приморским краем,'
+                   'в Республике Северной Осетии - Алания, в Москве')
+
+        assert (RegionFinderForTests(address)
+                ._find_region_names() == ['татарстан',
+                                          'ханты-мансийский',
+                                          'краснодарский',
+                                          'томская',
+                                          'алтайский',
+                                          'приморский',
+                                          'северная осетия',
+                                          'москва']
+                )
+
+    def test_find_region_names_unknown_declined(self):
+        """Названия-прилагательные не из справочника приводятся
+        к именительному падежу по окончанию, а слова без окончания
+        прилагательного перед статусом в косвенном падеже
+        не считаются названием региона."""
+
+        assert (RegionFinderForTests('Новой области')
+                ._find_region_names() == ['новая'])
+        assert not RegionFinderForTests('центр области')._find_region_names()
+
     def test_find_city_names(self):
         """Последовательность кириллических символов,
         между которыми может быть символ "-" (не более двух раз),
@@ -392,3 +425,189 @@ class TestRegion:
 
         for address in addresses:
             assert not RegionFinderForTests(address).is_address()
+
+    def test_scan_features(self):
+        """Однопроходный поиск возвращает все найденные категории
+        признаков адреса."""
+
+        address = ('125212 г. Москва, Ленинградское шоссе,'
+                   ' Кушвинский район, п. Вурнары')
+        assert RegionFinderForTests(address)._scan_features() == {
+            'street', 'region', 'postcode', 'city', 'district', 'settlement'
+        }
+
+        address = 'Томской области, Приморского края'
+        assert RegionFinderForTests(address)._scan_features() == {'region'}
+        assert RegionFinderForTests(address)._scan_features(
+            ['street', 'city']) == set()
+
+    def test_scan_features_first_hit(self):
+        """Поиск до первого признака возвращает не более одной
+        категории."""
+
+        address = '125212 г. Москва, Ленинградское шоссе'
+        features = RegionFinderForTests(address)._scan_features(
+            first_hit=True)
+        assert len(features) == 1
+        assert not RegionFinderForTests(
+            'Трикотажная 49/1')._scan_features(first_hit=True)
+
+    def test_scan_features_matches_find_methods(self):
+        """Категории однопроходного поиска совпадают с непустыми
+        результатами методов поиска."""
+
+        addresses = ['125212 г. Москва, Ленинградское шоссе',
+                     'Ивановской области, Кушвинский район',
+                     'п. Вурнары Чувашия Победы 17',
+                     'Трикотажная 49/1']
+        for address in addresses:
+            x = RegionFinderForTests(address)
+            found = {category for category, value in (
+                ('street', x._are_street_attrs_in_address()),
+                ('region', x._find_region_names()),
+                ('postcode', x._find_first_3_postcodes()),
+                ('city', x._find_city_names()),
+                ('district', x._find_district_names()),
+                ('settlement', x._find_settlement_names())) if value}
+            assert x._scan_features() == found
+
+    def test_find_methods_memoized(self, monkeypatch):
+        """Результаты методов поиска вычисляются один раз
+        для экземпляра и не передаются между экземплярами."""
+
+        calls = []
+        city_regex = RegionFinderForTests._city_name_regex
+
+        class CountingRegex:
+            pattern = city_regex.pattern
+
+            def findall(self, address):
+                calls.append(address)
+                return city_regex.findall(address)
+
+        monkeypatch.setattr(RegionFinderForTests, '_city_name_regex',
+                            CountingRegex())
+
+        x = RegionFinderForTests('г. Ижевск')
+        cities = x._find_city_names()
+        cities.append('мусор')
+
+        assert x._find_city_names() == ['ижевск']
+        assert x.is_address()
+        assert len(calls) == 1
+        assert RegionFinderForTests('г. Тюмень')._find_city_names() == [
+            'тюмень']
+        assert len(calls) == 2
+
+    def test_is_address_results_reused(self):
+        """После is_address методы поиска не запускают повторно
+        регулярные выражения, уже выполненные в is_address."""
+
+        calls = []
+
+        class CountingRegex:
+
+            def __init__(self, name, regex):
+                self.name = name
+                self.regex = regex
+
+            def search(self, address):
+                calls.append(self.name)
+                return self.regex.search(address)
+
+            def findall(self, address):
+                calls.append(self.name)
+                return self.regex.findall(address)
+
+            def finditer(self, address):
+                calls.append(self.name)
+                return self.regex.finditer(address)
+
+        names = ('_street_regex', '_postcode_regex',
+                 '_postcode_first_3_regex', '_region_name_regex',
+                 '_city_name_regex', '_district_regex', '_settlement_regex')
+        CountingFinder = type('CountingFinder', (RegionFinderForTests,), {
+            name: CountingRegex(name, getattr(RegionFinderForTests, name))
+            for name in names})
+
+        x = CountingFinder('634050 г. Томск, Кушвинский район')
+        assert x.is_address()
+        assert calls == ['_street_regex', '_region_name_regex',
+                         '_postcode_first_3_regex']
+
+        x._are_street_attrs_in_address()
+        x._find_postcodes()
+        x._find_first_3_postcodes()
+        x._find_region_names()
+        x._find_city_names()
+        x._find_district_names()
+        x._find_settlement_names()
+        assert sorted(calls) == sorted(names)
+
+    def test_memo_reset_on_address_change(self):
+        """При смене адресной строки результаты вычисляются заново."""
+
+        x = RegionFinderForTests('г. Ижевск')
+        assert x._find_city_names() == ['ижевск']
+
+        x.address = 'г. тюмень'
+        assert x._find_city_names() == ['тюмень']
+
+    def test_anchor_prefilter_skips_regex(self):
+        """Регулярное выражение не запускается, если в строке нет
+        подстрок, без которых оно не может совпасть."""
+
+        class FailingRegex:
+            # Обёртка исходного выражения не отключает проверку подстрок
+            __wrapped__ = RegionFinder._district_regex
+
+            def finditer(self, address):
+                raise AssertionError('регулярное выражение не нужно')
+
+        class FailingFinder(RegionFinderForTests):
+            _district_regex = FailingRegex()
+
+        x = FailingFinder('Кушвинский округ, п. Вурнары')
+
+        assert x._find_district_names() == []
+        assert x._find_settlement_names() == ['вурнары']
+
+    def test_anchor_prefilter_follows_replaced_patterns(self, monkeypatch):
+        """Регулярное выражение, заменённое во время работы, отключает
+        проверку подстрок, даже если она уже выполнялась."""
+
+        class CityAsDistrictFinder(RegionFinderForTests):
+            pass
+
+        x = CityAsDistrictFinder('Ижевск г. Ижевск')
+        assert x._find_district_names() == []
+
+        monkeypatch.setattr(CityAsDistrictFinder, '_district_regex',
+                            RegionFinder._city_name_regex)
+        x.address = 'ижевск г. ижевск'
+
+        assert x._find_district_names() == ['г. ижевск']
+
+    def test_anchor_prefilter_disabled_for_overridden_patterns(self):
+        """Для переопределённых в наследнике регулярных выражений
+        проверка подстрок не выполняется."""
+
+        class CityAsDistrictFinder(RegionFinderForTests):
+            _district_regex = RegionFinderForTests._city_name_regex
+
+        x = CityAsDistrictFinder('Ижевск г. Ижевск')
+
+        assert x._find_district_names() == ['г. ижевск']
+
+    def test_overridden_region_regex_without_groups(self):
+        """Выражение наследника без именованных групп возвращает
+        совпадения так же, как findall."""
+
+        class PlainFinder(RegionFinderForTests):
+            _region_name_regex = re.compile(r'\b[а-яё]+(?= область)')
+
+        class GroupFinder(RegionFinderForTests):
+            _region_name_regex = re.compile(r'\b([а-яё]+) область')
+
+        assert PlainFinder('Новая область')._find_region_names() == ['новая']
+        assert GroupFinder('Новая область')._find_region_names() == ['новая']
@@ -0,0 +1,112 @@
+import json
+import threading
+from http.client import HTTPConnection
+
+import pytest
+
+from region_finder_ru.server import RegionFinderServer
+
+
+@pytest.fixture
+def server():
+    server = RegionFinderServer(port=0, max_delay=0.01)
+    server.start()
+    yield server
+    server.close()
+
+
+def _request(server, method, path, body=None):
+    connection = HTTPConnection(*server.server_address, timeout=5)
+    try:
+        data = None if body is None else json.dumps(body).encode('utf-8')
+        connection.request(method, path, body=data)
+        response = connection.getresponse()
+        return response.status, json.loads(response.read().decode('utf-8'))
+    finally:
+        connection.close()
+
+
+class TestServer:
+
+    def test_single_and_bulk(self, server):
+        """Один адрес и набор адресов обрабатываются как в find_many."""
+
+        status, single = _request(server, 'POST', '/find',
+                                  {'address': '634050 г. Томск'})
+        assert status == 200
+        assert single['postcodes'] == ['634050']
+        assert single['city_names'] == ['томск']
+
+        status, bulk = _request(server, 'POST', '/find',
+                                {'addresses': ['Томская область', '']})
+        assert status == 200
+        assert bulk['results'][0]['region_names'] == ['томская']
+        assert bulk['results'][1]['error'] is not None
+
+    def test_concurrent_requests_are_batched(self, server):
+        """Одновременные запросы объединяются в части."""
+
+        results = {}
+
+        def send(index):
+            results[index] = _request(server, 'POST', '/find',
+                                      {'address': 'г. Томск {}'.format(index)})
+
+        threads = [threading.Thread(target=send, args=(index,))
+                   for index in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert all(results[index][1]['city_names'] == ['томск']
+                   for index in range(20))
+        _, metrics = _request(server, 'GET', '/metrics')
+        assert metrics['requests'] == 20
+        assert metrics['batches'] < 20
+        assert metrics['latency_p99_ms'] >= metrics['latency_p50_ms']
+
+    def test_health_and_errors(self, server):
+        assert _request(server, 'GET', '/healthz') == (200, {'status': 'ok'})
+        assert _request(server, 'GET', '/unknown')[0] == 404
+        assert _request(server, 'POST', '/find', {'addresses': 'x'})[0] == 400
+        assert _request(server, 'POST', '/find', [1])[0] == 400
+
+    def test_negative_content_length(self, server):
+        """Отрицательная длина тела запроса отклоняется без ожидания
+        закрытия соединения клиентом."""
+
+        connection = HTTPConnection(*server.server_address, timeout=5)
+        try:
+            connection.putrequest('POST', '/find')
+            connection.putheader('Content-Length', '-1')
+            connection.endheaders()
+            response = connection.getresponse()
+            assert response.status == 400
+            response.read()
+        finally:
+            connection.close()
+
+    def test_process_pool(self):
+        """При workers > 1 части обрабатываются в пуле процессов,
+        а ошибка передачи части в пул возвращается клиенту без
+        остановки очереди."""
+
+        with RegionFinderServer(port=0, workers=2, max_delay=0.01) as server:
+            server.start()
+            status, result = _request(server, 'POST', '/find',
+                                      {'addresses': ['634050 г. Томск',
+                                                     'Томская область']})
+            assert status == 200
+            assert result['results'][0]['city_names'] == ['томск']
+            assert result['results'][1]['region_names'] == ['томская']
+
+            server.batcher._executor.shutdown()
+            for _ in range(2):
+                status, _ = _request(server, 'POST', '/find',
+                                     {'address': 'г. Томск'})
+                assert status == 500
+            assert server.batcher._thread.is_alive()
+            _, metrics = _request(server, 'GET', '/metrics')
+            assert metrics['requests'] == 1
+            assert metrics['errors'] == 2
@@ -0,0 +1,64 @@
+import pytest
+
+from region_finder_ru import Span, SpanScanner, iter_spans, scan_file
+
+TEXT = ('Поставщик:  ООО «Ромашка», 634050 г. Томск,\n'
+        'ул. Ленина, д. 1,   Томская область. Покупатель: '
+        'Ивановской области, Кушвинский район, п. Вурнары')
+
+
+class TestSpans:
+
+    def test_spans_point_to_original_text(self):
+        """Позиции признаков указывают на исходный текст."""
+
+        found = [(span.category, TEXT[span.start:span.end])
+                 for span in iter_spans([TEXT])]
+
+        assert found == [('postcode', '634050'),
+                         ('city', 'Томск'),
+                         ('street', 'ул'),
+                         ('region', 'Томская'),
+                         ('region', 'Ивановской'),
+                         ('district', 'Кушвинский'),
+                         ('settlement', 'Вурнары')]
+
+    @pytest.mark.parametrize('size', [1, 5, 17, 64])
+    def test_chunks_do_not_change_spans(self, size):
+        """Признаки на границах порций находятся целиком."""
+
+        chunks = [TEXT[i:i + size] for i in range(0, len(TEXT), size)]
+
+        assert (list(iter_spans(chunks, overlap=32))
+                == list(iter_spans([TEXT])))
+
+    def test_quotes_separate_words(self):
+        """Кавычка между словами без пробела разделяет их так же,
+        как в normalize_address."""
+
+        text = 'ЖК "Солнечный"г. Томск, ТЦ «Мега»ул. Ленина'
+        found = [(span.category, text[span.start:span.end])
+                 for span in iter_spans([text])]
+
+        assert found == [('city', 'Томск'), ('street', 'ул')]
+
+    def test_categories(self):
+        """Ищутся только переданные категории."""
+
+        scanner = SpanScanner(categories=['postcode'])
+        spans = scanner.feed(TEXT) + scanner.close()
+
+        assert spans == [Span('postcode', 27, 33)]
+        with pytest.raises(ValueError):
+            SpanScanner(categories=['unknown'])
+
+    def test_scan_file(self, tmp_path):
+        """Файл читается порциями."""
+
+        path = tmp_path / 'contract.txt'
+        path.write_text(TEXT * 3, encoding='utf-8')
+
+        spans = list(scan_file(str(path), chunk_size=10, overlap=32))
+
+        assert len(spans) == 21
+        assert (TEXT * 3)[spans[-1].start:spans[-1].end] == 'Вурнары'